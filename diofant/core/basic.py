@@ -1,5 +1,7 @@
 """Base class for all the objects in Diofant."""
 
+import os
+import weakref
 from collections import defaultdict
 from collections.abc import Mapping
 from itertools import zip_longest
@@ -10,6 +12,57 @@
 from .sympify import SympifyError, sympify
 
 
+USE_INTERN = os.getenv('DIOFANT_USE_INTERN', 'False') == 'True'
+
+# global intern table: structural key -> canonical instance
+INTERN = weakref.WeakValueDictionary()
+
+
+class _NotCanonical(Exception):
+    pass
+
+
+def _intern_key(item):
+    if isinstance(item, Basic):
+        if item.is_Atom:
+            return (type(item),) + tuple(map(_intern_key,
+                                             item._hashable_content()))
+        if not item._interned:
+            raise _NotCanonical
+        return type(item), id(item)
+    elif isinstance(item, tuple):
+        return tuple(map(_intern_key, item))
+    return item
+
+
+def intern(obj):
+    """Return the canonical instance, structurally identical to ``obj``.
+
+    Interning (hash-consing) is enabled by the ``DIOFANT_USE_INTERN``
+    environment variable.  Then, the global table of weak references
+    to constructed compound objects is used to return the existing
+    instance instead of the new one.  Atoms are compared by their
+    type and hashable content, other arguments --- by identity, thus
+    only objects with interned (or atomic) arguments are interned.
+
+    """
+
+    if not USE_INTERN:
+        return obj
+
+    try:
+        key = (type(obj),) + tuple(map(_intern_key, obj._hashable_content()))
+        return INTERN[key]
+    except _NotCanonical:
+        return obj
+    except TypeError:  # unhashable content
+        return obj
+    except KeyError:
+        obj._interned = True
+        INTERN[key] = obj
+        return obj
+
+
 class Basic:
     """
     Base class for all objects in Diofant.
@@ -45,6 +98,8 @@ class Basic:
     is_MatMul = False
     is_Vector = False
 
+    _interned = False
+
     def __new__(cls, *args):
         obj = object.__new__(cls)
         obj._mhash = None  # will be set by __hash__ method.
@@ -1,6 +1,8 @@
 """ Caching facility for Diofant. """
 
+import collections
 import functools
+import heapq
 import os
 
 from .evaluate import global_evaluate
@@ -9,12 +11,45 @@
 # global cache registry: [] of (item, {})
 CACHE = []
 
+CacheInfo = collections.namedtuple('CacheInfo',
+                                   ['hits', 'misses', 'maxsize',
+                                    'currsize', 'evictions'])
+
 
 def print_cache():
-    """Print cache content."""
+    """Print cache statistics, see :func:`cache_stats`."""
+
+    for name, info in cache_stats().items():
+        print(name, info)
+
+
+def cache_stats():
+    """Return cache statistics as a dictionary.
+
+    Keys are qualified names of cached functions, values are
+    dictionaries with hit, miss and eviction counters, current and
+    maximal cache sizes and the eviction policy.
+
+    Examples
+    ========
+
+    >>> @cacheit
+    ... def f(a):
+    ...     return a
+    >>> f(x), f(x)
+    (x, x)
+    >>> cache_stats()['f']
+    {'currsize': 1, 'evictions': 0, 'hits': 1, 'maxsize': None,
+     'misses': 1, 'policy': 'lru'}
+
+    """
 
+    stats = {}
     for item in CACHE:
-        print(item.__qualname__, item.cache_info())
+        info = item.cache_info()._asdict()
+        info['policy'] = item.cache_policy
+        stats[item.__qualname__] = info
+    return stats
 
 
 def clear_cache():
@@ -23,14 +58,226 @@ def clear_cache():
         item.cache_clear()
 
 
+def _check_maxsize(maxsize):
+    if maxsize is not None and maxsize < 0:
+        raise ValueError("Cache size must be nonnegative, got %s" % maxsize)
+    return maxsize
+
+
+def _parse_maxsize(value):
+    if value in (None, 'None', ''):
+        return
+    return _check_maxsize(int(value))
+
+
 USE_CACHE = os.getenv('DIOFANT_USE_CACHE', 'True') == 'True'
+CACHE_SIZE = _parse_maxsize(os.getenv('DIOFANT_CACHE_SIZE'))
+CACHE_POLICY = os.getenv('DIOFANT_CACHE_POLICY', 'lru')
+
+
+def _make_key(args, kwargs):
+    key = args
+    if kwargs:
+        key += (_make_key,)
+        for item in kwargs.items():
+            key += item
+    key += tuple(type(v) for v in args)
+    if kwargs:
+        key += tuple(type(v) for v in kwargs.values())
+    return key
+
+
+class _LRUCache:
+    """Least recently used cache.
+
+    The unbounded cache is based on :func:`functools.lru_cache`, as
+    nothing is ever evicted there.
+
+    """
+
+    def __init__(self, func, maxsize):
+        self.func = func
+        self.maxsize = maxsize
+        if maxsize is None:
+            self.call = functools.lru_cache(maxsize=None, typed=True)(func)
+        else:
+            self.call = self._call
+        self.clear()
+
+    def _call(self, *args, **kwargs):
+        key = _make_key(args, kwargs)
+        try:
+            result = self.data[key]
+        except KeyError:
+            self.misses += 1
+            result = self.func(*args, **kwargs)
+            if self.maxsize == 0 or key in self.data:
+                return result
+            if len(self.data) >= self.maxsize:
+                self.data.popitem(last=False)
+                self.evictions += 1
+            self.data[key] = result
+            return result
+
+        self.hits += 1
+        self.data.move_to_end(key)
+        return result
+
+    def info(self):
+        if self.maxsize is None:
+            return CacheInfo(*self.call.cache_info(), 0)
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self.data), self.evictions)
+
+    def clear(self):
+        if self.maxsize is None:
+            self.call.cache_clear()
+        else:
+            self.data = collections.OrderedDict()
+            self.hits = self.misses = self.evictions = 0
+
+
+class _LFUCache:
+    """Least frequently used cache with dynamic aging.
+
+    New entries get the priority of the last evicted entry plus one,
+    every cache hit increments the priority.  Thus, entries that were
+    frequently used long time ago are eventually evicted.
+
+    """
+
+    def __init__(self, func, maxsize):
+        self.func = func
+        self.maxsize = maxsize
+        self.clear()
+
+    def call(self, *args, **kwargs):
+        key = _make_key(args, kwargs)
+        try:
+            entry = self.data[key]
+        except KeyError:
+            self.misses += 1
+            result = self.func(*args, **kwargs)
+            if self.maxsize == 0 or key in self.data:
+                return result
+            if self.maxsize is not None and len(self.data) >= self.maxsize:
+                self._evict()
+            self.data[key] = [result, self.age + 1]
+            self._push(self.age + 1, key)
+            return result
 
+        self.hits += 1
+        entry[1] += 1
+        return entry[0]
 
-def cacheit(f, maxsize=None):
+    def _push(self, priority, key):
+        self.count += 1
+        heapq.heappush(self.heap, (priority, self.count, key))
+
+    def _evict(self):
+        while True:
+            priority, _, key = heapq.heappop(self.heap)
+            current = self.data[key][1]
+            if current == priority:
+                break
+            self._push(current, key)
+        del self.data[key]
+        self.age = priority
+        self.evictions += 1
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize,
+                         len(self.data), self.evictions)
+
+    def clear(self):
+        self.data = {}
+        self.heap = []
+        self.age = self.count = 0
+        self.hits = self.misses = self.evictions = 0
+
+
+_POLICIES = {'lru': _LRUCache, 'lfu': _LFUCache}
+
+
+def _check_policy(policy):
+    if policy not in _POLICIES:
+        raise ValueError("Unknown cache policy: %s" % policy)
+
+
+def set_cache_size(maxsize, func=None):
+    """Set maximal size of the cache.
+
+    If ``func`` is omitted, set the global cache size, used by all
+    cached functions, that have no own size limit.  The ``None``
+    value means the unbounded cache or, if ``func`` is given, reset
+    the cache size of ``func`` to the global one.
+
+    Resizing clears affected caches.
+
+    Examples
+    ========
+
+    >>> @cacheit
+    ... def f(a):
+    ...     return a
+    >>> set_cache_size(2, f)
+    >>> f(1), f(2), f(3)
+    (1, 2, 3)
+    >>> f.cache_info().evictions
+    1
+    >>> set_cache_size(None, f)
+
+    """
+
+    global CACHE_SIZE
+
+    _check_maxsize(maxsize)
+    if func is None:
+        CACHE_SIZE = maxsize
+        for item in CACHE:
+            if not item.cache_local_size:
+                item.cache_resize(None)
+    else:
+        func.cache_resize(maxsize)
+
+
+def set_cache_policy(policy, func=None):
+    """Set eviction policy of the cache.
+
+    Supported policies are ``'lru'`` (least recently used) and
+    ``'lfu'`` (least frequently used).  If ``func`` is omitted, set
+    the global policy, used by all cached functions, that have no own
+    policy.  The ``None`` value for ``func`` resets its policy to
+    the global one.
+
+    Changing the policy clears affected caches.
+
+    """
+
+    global CACHE_POLICY
+
+    if func is None:
+        _check_policy(policy)
+        CACHE_POLICY = policy
+        for item in CACHE:
+            if not item.cache_local_policy:
+                item.cache_set_policy(None)
+    else:
+        func.cache_set_policy(policy)
+
+
+def cacheit(f, maxsize=None, policy=None):
     """Caching decorator.
 
     The result of cached function must be *immutable*.
 
+    The cache size is bounded by ``maxsize``, if given, or by the
+    global cache size (see :func:`set_cache_size`), which defaults
+    to the value of the ``DIOFANT_CACHE_SIZE`` environment variable
+    (unbounded if not set).  The ``policy`` (or the environment
+    variable ``DIOFANT_CACHE_POLICY``) controls eviction
+    of entries, see :func:`set_cache_policy`.
+
     Examples
     ========
 
@@ -48,18 +295,46 @@ def cacheit(f, maxsize=None):
     """
 
     if USE_CACHE:
-        cfunc = functools.lru_cache(maxsize=maxsize, typed=True)(f)
+        _check_maxsize(maxsize)
+        local_policy = policy is not None
+        policy = CACHE_POLICY if policy is None else policy
+        _check_policy(policy)
+        cache = _POLICIES[policy](f, CACHE_SIZE if maxsize is None else maxsize)
+        call = cache.call
 
         def wrapper(*args, **kwargs):
             try:
                 if global_evaluate[0] and kwargs.get('evaluate', True):
-                    return cfunc(*args, **kwargs)
+                    return call(*args, **kwargs)
             except TypeError:
                 pass
             return f(*args, **kwargs)
 
-        wrapper.cache_info = cfunc.cache_info
-        wrapper.cache_clear = cfunc.cache_clear
+        def cache_resize(maxsize):
+            nonlocal cache, call
+            _check_maxsize(maxsize)
+            wrapper.cache_local_size = maxsize is not None
+            maxsize = CACHE_SIZE if maxsize is None else maxsize
+            cache = type(cache)(f, maxsize)
+            call = cache.call
+
+        def cache_set_policy(policy):
+            nonlocal cache, call
+            if policy is not None:
+                _check_policy(policy)
+            wrapper.cache_local_policy = policy is not None
+            policy = CACHE_POLICY if policy is None else policy
+            cache = _POLICIES[policy](f, cache.maxsize)
+            call = cache.call
+            wrapper.cache_policy = policy
+
+        wrapper.cache_info = lambda: cache.info()
+        wrapper.cache_clear = lambda: cache.clear()
+        wrapper.cache_resize = cache_resize
+        wrapper.cache_set_policy = cache_set_policy
+        wrapper.cache_local_size = maxsize is not None
+        wrapper.cache_local_policy = local_policy
+        wrapper.cache_policy = policy
         functools.update_wrapper(wrapper, f)
 
         CACHE.append(wrapper)
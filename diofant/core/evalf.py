@@ -1289,6 +1289,103 @@ def evalf(self, dps=15, subs=None, maxn=110, chop=False, strict=True, quad=None)
 
     n = evalf
 
+    def evalf_batch(self, symbols, points, dps=15):
+        """
+        Evaluate the expression at many points.
+
+        The expression is compiled once (see
+        :func:`~diofant.utilities.lambdify.lambdify`) and then
+        evaluated with mpmath at the fixed working precision, a bit
+        higher than ``dps`` decimal digits.  Unlike :meth:`evalf`,
+        the precision is not adaptive, expressions with catastrophic
+        cancellation may need a bigger ``dps``.
+
+        Parameters
+        ==========
+
+        symbols : Symbol or sequence of Symbol's
+        points : iterable
+            Values of ``symbols``, a sequence of coordinates for every
+            point (or just the value, if ``symbols`` is a single
+            Symbol).  If ``points`` is a NumPy array and ``dps`` is at
+            most 15, the expression is evaluated with NumPy at machine
+            precision and an array is returned.
+        dps : int, optional
+            Decimal digits of accuracy.
+
+        Examples
+        ========
+
+        >>> (x**2 + y).evalf_batch((x, y), [(1, 2), (3, 4)])
+        [3.0, 13.0]
+        >>> sqrt(x).evalf_batch(x, [2, -1], 20)
+        [1.4142135623730950488, 1.0*I]
+
+        See Also
+        ========
+
+        evalf
+
+        """
+        from ..external import import_module
+        from ..utilities.lambdify import lambdify
+        from .numbers import Float, I, Rational
+
+        if is_sequence(symbols):
+            symbols = tuple(symbols)
+            scalar = False
+        else:
+            symbols = symbols,
+            scalar = True
+
+        numpy = import_module('numpy')
+        if numpy and isinstance(points, numpy.ndarray) and dps <= 15:
+            f = lambdify(symbols, self, 'numpy')
+            points = points.reshape((-1, len(symbols)))
+            try:
+                values = f(*points.T)
+            except NameError:
+                pass
+            else:
+                return numpy.broadcast_to(values, points.shape[:1]).copy()
+
+        points = [(p,) if scalar else tuple(p) for p in points]
+        for p in points:
+            if len(p) != len(symbols):
+                raise ValueError('expected %d coordinates, got %s' %
+                                 (len(symbols), p))
+
+        prec = dps_to_prec(dps)
+        wp = prec + 32
+        expr = self.xreplace({r: Float(r, prec_to_dps(wp))
+                              for r in self.atoms(Rational)
+                              if not r.is_Integer})
+        f = lambdify(symbols, expr, 'mpmath')
+
+        def to_mpmath(v):
+            return v._to_mpmath(wp) if hasattr(v, '_to_mpmath') else v
+
+        try:
+            with workprec(wp):
+                values = [mp.mpmathify(f(*map(to_mpmath, p)))
+                          for p in points]
+        except (NameError, TypeError):
+            # Fall back to the point-wise evaluation
+            return [self.subs(dict(zip(symbols, p))).evalf(dps)
+                    for p in points]
+
+        result = []
+        for v in values:
+            if isinstance(v, mpc):
+                re, im = v._mpc_
+                re = Float._new(re, prec) if re != fzero else S.Zero
+                if im != fzero:
+                    re += Float._new(im, prec)*I
+                result.append(re)
+            else:
+                result.append(Float._new(v._mpf_, prec))
+        return result
+
     def _evalf(self, prec):
         """Helper for evalf. Does the same thing but takes binary precision."""
         r = self._eval_evalf(prec)
@@ -34,7 +34,7 @@
 from ..utilities.iterables import uniq
 from .add import Add
 from .assumptions import ManagedProperties
-from .basic import Basic
+from .basic import Basic, intern
 from .cache import cacheit
 from .compatibility import (as_int, default_sort_key, is_sequence, iterable,
                             ordered)
@@ -231,7 +231,7 @@ def __new__(cls, *args, **options):
             nargs = obj._nargs  # note the underscore here
 
         obj.nargs = FiniteSet(*nargs) if nargs else Naturals0()
-        return obj
+        return intern(obj)
 
     @classmethod
     def eval(cls, *args):
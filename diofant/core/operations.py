@@ -1,4 +1,4 @@
-from .basic import _aresame
+from .basic import _aresame, intern
 from .cache import cacheit
 from .compatibility import ordered
 from .evaluate import global_evaluate
@@ -49,7 +49,7 @@ def _from_args(cls, args):
         elif len(args) == 1:
             return args[0]
 
-        return super().__new__(cls, *args)
+        return intern(super().__new__(cls, *args))
 
     def _new_rawargs(self, *args, **kwargs):
         """Create new instance of own class with args exactly as provided by
@@ -5,6 +5,7 @@
 from ..logic import true
 from ..utilities import sift
 from .add import Add
+from .basic import intern
 from .cache import cacheit
 from .compatibility import as_int
 from .evalf import PrecisionExhausted
@@ -231,7 +232,7 @@ def __new__(cls, b, e, evaluate=None):
                 obj = b._eval_power(e)
                 if obj is not None:
                     return obj
-        return Expr.__new__(cls, b, e)
+        return intern(Expr.__new__(cls, b, e))
 
     def _eval_is_commutative(self):
         return self.base.is_commutative and self.exp.is_commutative
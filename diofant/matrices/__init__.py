@@ -8,6 +8,7 @@
                     matrix_multiply_elementwise, ones, randMatrix, rot_axis1,
                     rot_axis2, rot_axis3, symarray, vandermonde, wronskian,
                     zeros)
+from .domainmatrix import DomainMatrix
 from .expressions import (Adjoint, BlockDiagMatrix, BlockMatrix, Determinant,
                           DiagonalMatrix, DiagonalOf, FunctionMatrix,
                           HadamardProduct, Identity, Inverse, MatAdd, MatMul,
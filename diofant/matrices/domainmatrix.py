@@ -0,0 +1,759 @@
+"""Dense matrices over domains."""
+
+import concurrent.futures
+import contextlib
+import itertools
+from math import gcd
+
+from ..ntheory import prevprime
+from ..ntheory.modular import symmetric_residue
+from ..polys.constructor import construct_domain
+from .matrices import NonSquareMatrixError, ShapeError
+
+
+__all__ = 'DomainMatrix',
+
+
+class DomainMatrix:
+    """Dense matrix with elements in a domain.
+
+    Elements are stored as a list of rows, each row is a list of
+    elements of the domain.  Algorithms work with domain elements
+    directly, without construction of expressions.  In particular,
+    matrices over integers and rationals use fraction-free elimination
+    on integers.
+
+    Examples
+    ========
+
+    >>> M = DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]]))
+    >>> M
+    DomainMatrix([[1, 2], [3, 4]], (2, 2), ZZ)
+    >>> M.det()
+    -2
+    >>> M.inv().to_Matrix()
+    Matrix([
+    [ -2,    1],
+    [3/2, -1/2]])
+
+    """
+
+    def __init__(self, rows, shape, domain):
+        if len(rows) != shape[0] or any(len(r) != shape[1] for r in rows):
+            raise ShapeError("Rows don't match the shape %s" % (shape,))
+        self.rep = rows
+        self.shape = shape
+        self.domain = domain
+
+    @classmethod
+    def from_list(cls, rows, domain=None, **options):
+        """Create a matrix from the list of rows of expressions.
+
+        If ``domain`` is omitted, the minimal domain is constructed
+        with :func:`~diofant.polys.constructor.construct_domain`,
+        that accepts ``options``.
+
+        """
+        shape = len(rows), len(rows[0]) if rows else 0
+        elements = [e for row in rows for e in row]
+        if domain is None:
+            domain, elements = construct_domain(elements, **options)
+        else:
+            elements = [domain.convert(e) for e in elements]
+        m = shape[1]
+        rows = [elements[i*m:(i + 1)*m] for i in range(shape[0])]
+        return cls(rows, shape, domain)
+
+    @classmethod
+    def from_Matrix(cls, M, domain=None, **options):
+        """Create a matrix from the :class:`~diofant.matrices.Matrix`.
+
+        See Also
+        ========
+
+        from_list
+
+        """
+        if not M.rows:
+            return cls([], M.shape, domain or construct_domain([])[0])
+        if not M.cols:
+            return cls([[]]*M.rows, M.shape, domain or construct_domain([])[0])
+        return cls.from_list(M.tolist(), domain, **options)
+
+    def to_Matrix(self):
+        """Convert to the :class:`~diofant.matrices.Matrix`."""
+        from .dense import MutableDenseMatrix
+
+        to_expr = self.domain.to_expr
+        return MutableDenseMatrix(*self.shape, [to_expr(e) for row in self.rep
+                                                for e in row])
+
+    def convert_to(self, domain):
+        """Convert elements of the matrix to ``domain``."""
+        K = self.domain
+        if domain == K:
+            return self.copy()
+        convert = domain.convert
+        rows = [[convert(e, K) for e in row] for row in self.rep]
+        return self.__class__(rows, self.shape, domain)
+
+    def to_field(self):
+        """Convert elements of the matrix to the field of fractions."""
+        return self.convert_to(self.domain.field)
+
+    def unify(self, other):
+        """Convert both matrices to the common domain."""
+        K = self.domain.unify(other.domain)
+        return self.convert_to(K), other.convert_to(K)
+
+    @classmethod
+    def zeros(cls, shape, domain):
+        """Return the zero matrix of the given shape."""
+        return cls([[domain.zero]*shape[1] for _ in range(shape[0])],
+                   shape, domain)
+
+    @classmethod
+    def eye(cls, n, domain):
+        """Return the identity matrix of size ``n``."""
+        M = cls.zeros((n, n), domain)
+        for i in range(n):
+            M.rep[i][i] = domain.one
+        return M
+
+    def copy(self):
+        return self.__class__([row[:] for row in self.rep], self.shape,
+                              self.domain)
+
+    def __repr__(self):
+        rows = ', '.join('[%s]' % ', '.join(map(str, row))
+                         for row in self.rep)
+        return 'DomainMatrix([%s], %s, %s)' % (rows, self.shape, self.domain)
+
+    def __eq__(self, other):
+        if not isinstance(other, DomainMatrix):
+            return NotImplemented
+        return (self.shape == other.shape and self.domain == other.domain and
+                self.rep == other.rep)
+
+    def __getitem__(self, key):
+        i, j = key
+        return self.rep[i][j]
+
+    @property
+    def is_square(self):
+        return self.shape[0] == self.shape[1]
+
+    def transpose(self):
+        rows = [list(col) for col in zip(*self.rep)] or [[]]*self.shape[1]
+        return self.__class__(rows, self.shape[::-1], self.domain)
+
+    T = property(transpose)
+
+    def __neg__(self):
+        return self.__class__([[-e for e in row] for row in self.rep],
+                              self.shape, self.domain)
+
+    def __add__(self, other):
+        if not isinstance(other, DomainMatrix):
+            return NotImplemented
+        if self.shape != other.shape:
+            raise ShapeError("Matrix size mismatch: %s + %s" %
+                             (self.shape, other.shape))
+        A, B = self.unify(other)
+        rows = [[a + b for a, b in zip(ra, rb)]
+                for ra, rb in zip(A.rep, B.rep)]
+        return self.__class__(rows, self.shape, A.domain)
+
+    def __sub__(self, other):
+        if not isinstance(other, DomainMatrix):
+            return NotImplemented
+        return self + (-other)
+
+    def __mul__(self, other):
+        if not isinstance(other, DomainMatrix):
+            other = self.domain.convert(other)
+            rows = [[e*other for e in row] for row in self.rep]
+            return self.__class__(rows, self.shape, self.domain)
+        if self.shape[1] != other.shape[0]:
+            raise ShapeError("Matrix size mismatch: %s * %s" %
+                             (self.shape, other.shape))
+        A, B = self.unify(other)
+        K = A.domain
+        cols = list(zip(*B.rep))
+        rows = [[sum((a*b for a, b in zip(row, col)), K.zero)
+                 for col in cols] for row in A.rep]
+        return self.__class__(rows, (self.shape[0], other.shape[1]), K)
+
+    def __rmul__(self, other):
+        return self*other
+
+    def _integer_rows(self):
+        """Return rows, scaled to integers, and the product of scales."""
+        K = self.domain
+        ZZ = K.ring
+        rows, scale = [], ZZ.one
+        for row in self.rep:
+            d = ZZ.one
+            for e in row:
+                d = ZZ.lcm(d, e.denominator)
+            rows.append([e.numerator*(d // e.denominator) for e in row])
+            scale *= d
+        return rows, scale
+
+    def det(self, method='bareiss', workers=None, proof=True):
+        """Compute the determinant.
+
+        Over integers (and rationals, after clearing of denominators)
+        Bareiss' fraction-free algorithm is used by default.  With
+        ``method='modular'``, the determinant is computed modulo word-size
+        primes (in a process pool, if ``workers`` > 1) and reconstructed
+        with the Chinese remainder theorem, until the product of primes
+        exceeds the Hadamard bound.  If ``proof`` is False, the
+        computation stops early, once the reconstructed value is
+        unchanged by a new prime.
+
+        Other rings use Gaussian elimination in the field of fractions.
+
+        Examples
+        ========
+
+        >>> M = DomainMatrix.from_list([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+        >>> M.det(method='modular')
+        -3
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixError()
+        if method not in ('bareiss', 'modular'):
+            raise ValueError("Determinant method '%s' unrecognized" % method)
+        K = self.domain
+        if not self.shape[0]:
+            return K.one
+        if K.is_RationalField or K.is_IntegerRing:
+            if K.is_RationalField:
+                rows, scale = self._integer_rows()
+            else:
+                rows, scale = [row[:] for row in self.rep], K.one
+            if method == 'modular':
+                det = _det_modular(rows, workers, proof)
+            else:
+                det = _bareiss(rows)
+            if K.is_IntegerRing:
+                return det
+            return K.convert(det, K.ring)/scale
+        elif not K.is_Field:
+            return K.convert(self.to_field().det(), K.field)
+        rows = [row[:] for row in self.rep]
+        det, n = K.one, self.shape[0]
+        for i in range(n):
+            for r in range(i, n):
+                if rows[r][i]:
+                    break
+            else:
+                return K.zero
+            if r != i:
+                rows[i], rows[r] = rows[r], rows[i]
+                det = -det
+            ri = rows[i]
+            p = ri[i]
+            det *= p
+            for k in range(i + 1, n):
+                rk = rows[k]
+                if rk[i]:
+                    m = rk[i]/p
+                    rows[k] = [a - m*b for a, b in zip(rk, ri)]
+        return det
+
+    def rref(self):
+        """Return the reduced row echelon form and indices of pivots.
+
+        The result is a matrix over the field of fractions.
+
+        """
+        K = self.domain
+        if K.is_RationalField or K.is_IntegerRing:
+            F = K.field
+            if K.is_RationalField:
+                rows = self._integer_rows()[0]
+            else:
+                rows = [row[:] for row in self.rep]
+            pivots, d = _ffgj(rows, self.shape[1])
+            rows = [[F(e, d) for e in row] for row in rows]
+            return self.__class__(rows, self.shape, F), pivots
+        elif not K.is_Field:
+            return self.to_field().rref()
+        rows = [row[:] for row in self.rep]
+        pivots = _gauss_jordan(rows, self.shape[1])
+        return self.__class__(rows, self.shape, K), pivots
+
+    def rank(self, method=None, workers=None, proof=True):
+        """Return the rank of the matrix.
+
+        For integer and rational matrices the default method is
+        ``'modular'``: the rank is computed modulo word-size primes (in
+        a process pool, if ``workers`` > 1).  It never exceeds the true
+        rank and is certified, once it's maximal or the product of primes
+        exceeds the Hadamard bound for minors.  If ``proof`` is False,
+        the computation stops, once two primes give same rank.
+
+        Other domains (or ``method='rref'``) use :meth:`rref`.
+
+        """
+        if method not in (None, 'modular', 'rref'):
+            raise ValueError("Rank method '%s' unrecognized" % method)
+        K = self.domain
+        if (K.is_RationalField or K.is_IntegerRing) and method != 'rref':
+            rows = self._integer_rows()[0] if K.is_RationalField else self.rep
+            return _rank_modular(rows, self.shape[1], workers, proof)
+        return len(self.rref()[1])
+
+    def nullspace(self, method=None, workers=None):
+        """Return a list of vectors, that span the nullspace.
+
+        Vectors are returned as rows of a matrix over the field of
+        fractions.
+
+        For integer and rational matrices the default method is
+        ``'modular'``: the reduced row echelon form is computed modulo
+        word-size primes (in a process pool, if ``workers`` > 1),
+        primes with wrong pivots are discarded and entries are recovered
+        by the rational reconstruction.  The result is certified by the
+        multiplication on the matrix.
+
+        Other domains (or ``method='rref'``) use :meth:`rref`.
+
+        Examples
+        ========
+
+        >>> M = DomainMatrix.from_list([[1, 2, 3], [2, 4, 6]])
+        >>> M.nullspace()
+        DomainMatrix([[-2, 1, 0], [-3, 0, 1]], (2, 3), QQ)
+
+        """
+        if method not in (None, 'modular', 'rref'):
+            raise ValueError("Nullspace method '%s' unrecognized" % method)
+        K, n = self.domain, self.shape[1]
+        if (K.is_RationalField or K.is_IntegerRing) and method != 'rref':
+            F = K.field
+            rows = self._integer_rows()[0] if K.is_RationalField else self.rep
+            pivots, R = _rref_modular(rows, n, workers)
+            R = [[F(*e) for e in row] for row in R]
+        else:
+            R, pivots = self.rref()
+            F, R = R.domain, R.rep
+        basis = []
+        for f in range(n):
+            if f in pivots:
+                continue
+            v = [F.zero]*n
+            v[f] = F.one
+            for i, p in enumerate(pivots):
+                v[p] = -R[i][f]
+            basis.append(v)
+        return self.__class__(basis, (len(basis), n), F)
+
+    def inv(self):
+        """Return the inverse of the matrix over the field of fractions.
+
+        Raises
+        ======
+
+        ValueError
+            If the determinant of the matrix is zero.
+
+        """
+        if not self.is_square:
+            raise NonSquareMatrixError()
+        n = self.shape[0]
+        I = self.eye(n, self.domain)
+        rows = [r + e for r, e in zip(self.rep, I.rep)]
+        aug = self.__class__(rows, (n, 2*n), self.domain)
+        R, pivots = aug.rref()
+        if pivots[:n] != list(range(n)):
+            raise ValueError("Matrix det == 0; not invertible.")
+        return self.__class__([row[n:] for row in R.rep], (n, n), R.domain)
+
+
+def _bareiss(rows):
+    """Compute the determinant with Bareiss' fraction-free algorithm.
+
+    Elements of ``rows`` must be elements of an integral domain,
+    supporting exact division with ``//``.  Rows are modified
+    in place.
+
+    """
+    n = len(rows)
+    sign, prev = 1, 1
+    for i in range(n - 1):
+        for r in range(i, n):
+            if rows[r][i]:
+                break
+        else:
+            return 0*prev
+        if r != i:
+            rows[i], rows[r] = rows[r], rows[i]
+            sign = -sign
+        ri = rows[i]
+        p = ri[i]
+        for k in range(i + 1, n):
+            rk = rows[k]
+            m = rk[i]
+            rows[k] = rk[:i + 1] + [(p*a - m*b)//prev
+                                    for a, b in zip(rk[i + 1:], ri[i + 1:])]
+        prev = p
+    return sign*rows[-1][-1]
+
+
+def _ffgj(rows, ncols):
+    """Fraction-free Gauss-Jordan elimination.
+
+    Rows (lists of integers, or elements of an integral domain with
+    exact ``//``) are modified in place, so they form the reduced row
+    echelon form, multiplied by ``d``.  Returns list of pivot columns
+    and ``d``.
+
+    References
+    ==========
+
+    * :cite:`Nakos1997fractionfree`
+
+    """
+    nrows = len(rows)
+    pivots, prev, i = [], 1, 0
+    for c in range(ncols):
+        if i == nrows:
+            break
+        for r in range(i, nrows):
+            if rows[r][c]:
+                break
+        else:
+            continue
+        rows[i], rows[r] = rows[r], rows[i]
+        ri = rows[i]
+        p = ri[c]
+        for k in range(nrows):
+            if k == i:
+                continue
+            rk = rows[k]
+            m = rk[c]
+            if m:
+                rows[k] = [(p*a - m*b)//prev for a, b in zip(rk, ri)]
+            elif p != prev:
+                rows[k] = [p*a//prev for a in rk]
+        pivots.append(c)
+        prev = p
+        i += 1
+    return pivots, prev
+
+
+def _gauss_jordan(rows, ncols):
+    """Gauss-Jordan elimination over a field.
+
+    Rows are modified in place to form the reduced row echelon form.
+    Returns list of pivot columns.
+
+    """
+    nrows = len(rows)
+    pivots, i = [], 0
+    for c in range(ncols):
+        if i == nrows:
+            break
+        for r in range(i, nrows):
+            if rows[r][c]:
+                break
+        else:
+            continue
+        rows[i], rows[r] = rows[r], rows[i]
+        ri = rows[i]
+        p = ri[c]
+        if p != 1:
+            ri = rows[i] = [a/p for a in ri]
+        for k in range(nrows):
+            if k == i:
+                continue
+            rk = rows[k]
+            m = rk[c]
+            if m:
+                rows[k] = [a - m*b for a, b in zip(rk, ri)]
+        pivots.append(c)
+        i += 1
+    return pivots
+
+
+_MODULI = []
+
+
+def _moduli():
+    """Generate primes below ``2**62`` in descending order."""
+    yield from _MODULI
+    p = _MODULI[-1] if _MODULI else 2**62
+    while True:
+        p = prevprime(p)
+        _MODULI.append(p)
+        yield p
+
+
+def _modular_images(func, args, workers=None):
+    """Generate pairs ``(p, func(*args, p))`` for primes from :func:`_moduli`.
+
+    If ``workers`` > 1, images are computed in batches by a process
+    pool.
+
+    """
+    if workers and workers > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(workers)
+        batch = workers
+    else:
+        executor = None
+        batch = 1
+
+    moduli = _moduli()
+
+    try:
+        while True:
+            primes = list(itertools.islice(moduli, batch))
+            if executor is not None:
+                images = executor.map(func, *zip(*[args + (p,)
+                                                    for p in primes]))
+            else:
+                images = [func(*args, p) for p in primes]
+            yield from zip(primes, images)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+def _hadamard_bound(rows, ncols):
+    """Return the square of Hadamard's bound for minors of integer matrix."""
+    bound = []
+    for vectors in (rows, zip(*rows) if rows else [()]*ncols):
+        b = 1
+        for v in vectors:
+            b *= max(1, sum(a*a for a in v))
+        bound.append(b)
+    return min(bound)
+
+
+def _crt_update(c, m, u, p):
+    """Return ``x`` with ``x = c mod m``, ``x = u mod p`` and ``|x| <= m*p/2``."""
+    c += m*((u - c)*pow(m, p - 2, p) % p)
+    m *= p
+    if 2*c > m:
+        c -= m
+    return c
+
+
+def _rational_reconstruction(c, m):
+    """Return ``(a, b)`` with ``a = b*c mod m`` and ``|a|, b < sqrt(m/2)``.
+
+    Returns ``None``, if there are no such integers.
+
+    """
+    r0, s0 = m, 0
+    r1, s1 = c % m, 1
+    while 2*r1*r1 >= m:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q*r1
+        s0, s1 = s1, s0 - q*s1
+    if 2*s1*s1 >= m:
+        return
+    if s1 < 0:
+        r1, s1 = -r1, -s1
+    return r1, s1
+
+
+def _eliminate_mod(rows, p):
+    """Eliminate the first column of rows modulo prime ``p``.
+
+    Returns the index of the pivot row (or ``None``, if the column is
+    zero), the pivot and the rest of rows (without pivot row and
+    the first column).
+
+    """
+    for r, row in enumerate(rows):
+        if row[0]:
+            break
+    else:
+        return None, 0, [row[1:] for row in rows]
+    pivot = rows[r]
+    c = pivot[0]
+    inv = pow(c, p - 2, p)
+    pivot = pivot[1:]
+    new = []
+    for i, row in enumerate(rows):
+        if i == r:
+            continue
+        m = row[0]*inv % p
+        if m:
+            new.append([(a - m*b) % p for a, b in zip(row[1:], pivot)])
+        else:
+            new.append(row[1:])
+    return r, c, new
+
+
+def _det_mod(rows, p):
+    """Return the determinant of integer matrix modulo prime ``p``."""
+    rows = [[a % p for a in row] for row in rows]
+    det = 1
+    while rows:
+        r, pivot, rows = _eliminate_mod(rows, p)
+        if r is None:
+            return 0
+        det = det*(-pivot if r % 2 else pivot) % p
+    return det
+
+
+def _rank_mod(rows, ncols, p):
+    """Return the rank of integer matrix modulo prime ``p``."""
+    rows = [[a % p for a in row] for row in rows]
+    rank = 0
+    for _ in range(ncols):
+        if not rows:
+            break
+        r, _, rows = _eliminate_mod(rows, p)
+        if r is not None:
+            rank += 1
+    return rank
+
+
+def _rref_mod(rows, ncols, p):
+    """Return the reduced row echelon form of integer matrix modulo ``p``.
+
+    Returns list of pivots and nonzero rows of the reduced row echelon
+    form.
+
+    """
+    rows = [[a % p for a in row] for row in rows]
+    nrows = len(rows)
+    pivots, i = [], 0
+    for c in range(ncols):
+        if i == nrows:
+            break
+        for r in range(i, nrows):
+            if rows[r][c]:
+                break
+        else:
+            continue
+        rows[i], rows[r] = rows[r], rows[i]
+        ri = rows[i]
+        inv = pow(ri[c], p - 2, p)
+        ri = rows[i] = [a*inv % p for a in ri]
+        for k in range(nrows):
+            if k == i:
+                continue
+            rk = rows[k]
+            m = rk[c]
+            if m:
+                rows[k] = [(a - m*b) % p for a, b in zip(rk, ri)]
+        pivots.append(c)
+        i += 1
+    return pivots, rows[:i]
+
+
+def _det_modular(rows, workers=None, proof=True):
+    """Multi-modular determinant of integer matrix.
+
+    References
+    ==========
+
+    * :cite:`Bronnimann1999sign`
+
+    """
+    bound = 4*_hadamard_bound(rows, len(rows))
+    det, m = 0, 1
+    with contextlib.closing(_modular_images(_det_mod, (rows,),
+                                            workers)) as images:
+        for p, d in images:
+            if not proof and m > 1 and (det - d) % p == 0:
+                return det
+            det = _crt_update(det, m, d, p)
+            m *= p
+            if m*m > bound:
+                return det
+
+
+def _rank_modular(rows, ncols, workers=None, proof=True):
+    """Multi-modular rank of integer matrix."""
+    full = min(len(rows), ncols)
+    if not full:
+        return 0
+    bound = _hadamard_bound(rows, ncols)
+    rank, m = -1, 1
+    with contextlib.closing(_modular_images(_rank_mod, (rows, ncols),
+                                            workers)) as images:
+        for p, r in images:
+            if not proof and r == rank:
+                return rank
+            rank = max(rank, r)
+            m *= p
+            if rank == full or m*m > bound:
+                return rank
+
+
+def _rref_modular(rows, ncols, workers=None):
+    """Multi-modular reduced row echelon form of integer matrix.
+
+    Returns list of pivots and rows of the reduced row echelon form,
+    with entries as pairs of numerator and denominator.  For primes
+    with wrong pivots the rank is smaller or pivots are shifted to the
+    right, so only images with the best pivots are used.  Once rational
+    reconstruction is stable, the result is verified by multiplication
+    of the nullspace basis on the matrix.
+
+    """
+    groups = {}  # pivots -> [modulus, images]
+    last = None
+    with contextlib.closing(_modular_images(_rref_mod, (rows, ncols),
+                                            workers)) as images:
+        for p, (pivots, R) in images:
+            key = tuple(pivots)
+            if len(key) == ncols:
+                return pivots, [[(int(i == j), 1) for j in range(ncols)]
+                                for i in range(ncols)]
+            free = [j for j in range(ncols) if j not in pivots]
+            R = [[row[j] for j in free] for row in R]
+            if key not in groups:
+                groups[key] = [p, [[symmetric_residue(e, p) for e in row]
+                                   for row in R]]
+            else:
+                m, C = groups[key]
+                C = [[_crt_update(c, m, e, p) for c, e in zip(rc, re)]
+                     for rc, re in zip(C, R)]
+                groups[key] = [m*p, C]
+
+            key = max(groups, key=lambda k: (len(k), [-c for c in k]))
+            m, C = groups[key]
+            R = [[_rational_reconstruction(c, m) for c in row] for row in C]
+            if any(e is None for row in R for e in row) or R != last:
+                last = R
+                continue
+
+            pivots = list(key)
+            free = [j for j in range(ncols) if j not in pivots]
+            if _check_nullspace(rows, pivots, free, R):
+                rref = [[(int(j == c), 1) for j in range(ncols)]
+                        for c in pivots]
+                for i, row in enumerate(R):
+                    for j, e in zip(free, row):
+                        rref[i][j] = e
+                return pivots, rref
+
+
+def _check_nullspace(rows, pivots, free, R):
+    """Check, that vectors given by the reduced row echelon form are
+    in the nullspace of integer matrix.
+
+    """
+    for k, f in enumerate(free):
+        d = 1
+        for row in R:
+            d = d*row[k][1]//gcd(d, row[k][1])
+        v = {f: d}
+        for i, row in enumerate(R):
+            a, b = row[k]
+            if a:
+                v[pivots[i]] = -a*(d//b)
+        for row in rows:
+            if sum(row[j]*c for j, c in v.items()):
+                return False
+    return True
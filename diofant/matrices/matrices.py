@@ -2439,6 +2439,21 @@ def det(self, method="bareis"):
         else:
             raise ValueError("Determinant method '%s' unrecognized" % method)
 
+    def _to_domain_matrix(self):
+        """Return the matrix over integers or rationals, if possible.
+
+        See Also
+        ========
+
+        diofant.matrices.domainmatrix.DomainMatrix
+
+        """
+        from .domainmatrix import DomainMatrix
+
+        rows = self.tolist()
+        if all(e.is_Rational for row in rows for e in row):
+            return DomainMatrix.from_list(rows)
+
     def det_bareis(self):
         """Compute matrix determinant using Bareis' fraction-free
         algorithm which is an extension of the well known Gaussian
@@ -2465,6 +2480,10 @@ def det_bareis(self):
         if not self:
             return Integer(1)
 
+        D = self._to_domain_matrix()
+        if D is not None:
+            return D.domain.to_expr(D.det())
+
         M, n = self.copy().as_mutable(), self.rows
 
         if n == 1:
@@ -2598,6 +2617,10 @@ def inverse_GE(self, iszerofunc=_iszero):
         if not self.is_square:
             raise NonSquareMatrixError("A Matrix must be square to invert.")
 
+        D = self._to_domain_matrix()
+        if D is not None and iszerofunc is _iszero:
+            return self._new(D.inv().to_Matrix())
+
         big = Matrix.hstack(self.as_mutable(), Matrix.eye(self.rows))
         red = big.rref(iszerofunc=iszerofunc, simplify=True)[0]
         if any(iszerofunc(red[j, j]) for j in range(red.rows)):
@@ -2643,6 +2666,12 @@ def rref(self, iszerofunc=_iszero, simplify=False):
         [0, 1]]), [0, 1])
 
         """
+        if iszerofunc is _iszero:
+            D = self._to_domain_matrix()
+            if D is not None:
+                R, pivotlist = D.rref()
+                return self._new(R.to_Matrix()), pivotlist
+
         simpfunc = simplify if isinstance(
             simplify, FunctionType) else _simplify
         # pivot: index of next row to contain a pivot
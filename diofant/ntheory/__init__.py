@@ -7,9 +7,10 @@
                                  continued_fraction_periodic,
                                  continued_fraction_reduce)
 from .egyptian_fraction import egyptian_fraction
-from .factor_ import (divisor_count, divisor_sigma, divisors, factorint,
-                      factorrat, multiplicity, perfect_power, pollard_pm1,
-                      pollard_rho, primefactors, totient, trailing)
+from .factor_ import (divisor_count, divisor_sigma, divisors, ecm, factorint,
+                      factorint_many, factorrat, multiplicity, perfect_power,
+                      pollard_pm1, pollard_rho, primefactors, totient,
+                      trailing)
 from .generate import (Sieve, cycle_length, nextprime, prevprime, prime,
                        primepi, primerange, primorial, randprime, sieve)
 from .multinomial import (binomial_coefficients, binomial_coefficients_list,
@@ -2,6 +2,10 @@
 Integer factorization
 """
 
+import atexit
+import concurrent.futures
+import functools
+import itertools
 import math
 import numbers
 import random
@@ -612,6 +616,153 @@ def pollard_pm1(n, B=10, a=2, retries=0, seed=1234):
         a = prng.randint(2, n - 2)
 
 
+def _ecm_add(P, Q, D, n):
+    """Return P + Q on a Montgomery curve, given D = P - Q."""
+    u = (P[0] - P[1])*(Q[0] + Q[1])
+    v = (P[0] + P[1])*(Q[0] - Q[1])
+    add, sub = u + v, u - v
+    return D[1]*add*add % n, D[0]*sub*sub % n
+
+
+def _ecm_double(P, a24, n):
+    """Return 2*P on a Montgomery curve with (A + 2)/4 = a24."""
+    s = (P[0] + P[1])**2 % n
+    d = (P[0] - P[1])**2 % n
+    t = s - d
+    return s*d % n, t*(d + a24*t) % n
+
+
+def _ecm_mul(k, P, a24, n):
+    """Return k*P on a Montgomery curve (Montgomery's ladder)."""
+    R0, R1 = P, _ecm_double(P, a24, n)
+    for b in bin(k)[3:]:
+        if b == '1':
+            R0, R1 = _ecm_add(R1, R0, P, n), _ecm_double(R1, a24, n)
+        else:
+            R0, R1 = _ecm_double(R0, a24, n), _ecm_add(R1, R0, P, n)
+    return R0
+
+
+def ecm(n, B1=10000, B2=None, max_curves=200, seed=1234):
+    r"""
+    Use Lenstra's elliptic curve method to try to extract a nontrivial
+    factor of ``n``.  Either a divisor (perhaps composite) or ``None``
+    is returned.
+
+    Up to ``max_curves`` random curves in Montgomery form with Suyama's
+    parametrization (chosen using the ``seed``) are tried.  A factor
+    `p` of ``n`` is found, if the order of the curve modulo `p` is
+    ``B1``-powersmooth, except for at most one prime factor below
+    ``B2`` (default is ``100*B1``).  Unlike :func:`pollard_pm1`, the
+    group order varies with the curve, so trying more curves helps.
+    Expected running time depends on the size of the smallest factor
+    of ``n``, rather than on the size of ``n``.
+
+    Examples
+    ========
+
+    >>> ecm(10000000019*10000000000000000000000013)
+    10000000019
+
+    References
+    ==========
+
+    * Richard Crandall & Carl Pomerance (2005), "Prime Numbers:
+      A Computational Perspective", Springer, 2nd edition, 335-352
+
+    """
+
+    n = int(n)
+    if n < 5:
+        raise ValueError('ecm should receive n > 4')
+    if B2 is None:
+        B2 = 100*B1
+    prng = random.Random(seed + B1)
+
+    primes = list(sieve.primerange(2, B1 + 1))
+    # baby steps j*Q for 0 < j < D/2, gcd(j, D) = 1
+    D = 2310
+    J = [j for j in range(1, D//2, 2) if math.gcd(j, D) == 1]
+
+    for _ in range(max_curves):
+        sigma = prng.randint(6, n - 1)
+        u = (sigma*sigma - 5) % n
+        v = 4*sigma % n
+        x0 = pow(u, 3, n)
+        den = 16*x0*v % n
+        g = math.gcd(den, n)
+        if g == n:
+            continue
+        elif g > 1:
+            return g
+        a24 = pow(v - u, 3, n)*(3*u + v)*pow(den, -1, n) % n
+        Q = x0, pow(v, 3, n)
+
+        # stage 1
+        for p in primes:
+            Q = _ecm_mul(p**int(math.log(B1, p)), Q, a24, n)
+        g = math.gcd(Q[1], n)
+        if g == n:
+            continue
+        elif g > 1:
+            return g
+
+        # stage 2, baby-step giant-step continuation
+        Q2 = _ecm_double(Q, a24, n)
+        S = {1: Q}
+        prev, cur = Q, Q
+        for j in range(3, D//2, 2):
+            prev, cur = cur, _ecm_add(cur, Q2, prev, n)
+            S[j] = cur
+        S = [S[j] for j in J]
+
+        m = max(B1//D, 2)
+        DQ = _ecm_mul(D, Q, a24, n)
+        R, Rprev = _ecm_mul(m*D, Q, a24, n), _ecm_mul((m - 1)*D, Q, a24, n)
+        g = 1
+        while m*D < B2 + D:
+            for P in S:
+                g = g*(R[0]*P[1] - P[0]*R[1]) % n
+            R, Rprev = _ecm_add(R, DQ, Rprev, n), R
+            m += 1
+        g = math.gcd(g, n)
+        if 1 < g < n:
+            return g
+
+
+@functools.lru_cache(maxsize=None)
+def _executor(workers):
+    """Return a process pool with given number of workers."""
+    executor = concurrent.futures.ProcessPoolExecutor(workers)
+    atexit.register(executor.shutdown)
+    return executor
+
+
+def _find_factor(n, method, args, workers=None):
+    """
+    Helper function for integer factorization.  Calls ``method(n,
+    **kw)`` for every ``kw`` in ``args`` and returns the first found
+    factor or ``None``.  If ``workers`` > 1, calls are made in a
+    process pool.
+
+    """
+    if workers and workers > 1:
+        futures = [_executor(workers).submit(method, n, **kw) for kw in args]
+        try:
+            for f in concurrent.futures.as_completed(futures):
+                c = f.result()
+                if c:
+                    return c
+        finally:
+            for f in futures:
+                f.cancel()
+    else:
+        for kw in args:
+            c = method(n, **kw)
+            if c:
+                return c
+
+
 def _trial(factors, n, candidates, verbose=False):
     """
     Helper function for integer factorization. Trial factors ``n`
@@ -635,7 +786,7 @@ def _trial(factors, n, candidates, verbose=False):
 
 
 def _check_termination(factors, n, limitp1, use_trial, use_rho, use_pm1,
-                       verbose):
+                       verbose, use_ecm=True, workers=None):
     """
     Helper function for integer factorization. Checks if ``n``
     is a prime or a perfect power, and in those cases updates
@@ -656,7 +807,7 @@ def _check_termination(factors, n, limitp1, use_trial, use_rho, use_pm1,
         else:
             limit = limitp1
         facs = factorint(base, limit, use_trial, use_rho, use_pm1,
-                         verbose=False)
+                         verbose=False, use_ecm=use_ecm, workers=workers)
         for b, e in facs.items():
             if verbose:
                 print(factor_msg % (b, e))
@@ -676,11 +827,15 @@ def _check_termination(factors, n, limitp1, use_trial, use_rho, use_pm1,
 trial_int_msg = "Trial division with ints [%i ... %i] and fail_max=%i"
 trial_msg = "Trial division with primes [%i ... %i]"
 rho_msg = "Pollard's rho with retries %i, max_steps %i and seed %i"
+ecm_msg = "Lenstra's ECM with smoothness bound %i, %i curves and seed %i"
 pm1_msg = "Pollard's p-1 with smoothness bound %i and seed %i"
 factor_msg = '\t%i ** %i'
 fermat_msg = 'Close factors satisying Fermat condition found.'
 complete_msg = 'Factorization is complete.'
 
+# ECM is used for numbers with more than 20 digits
+ecm_min = 10**20
+
 
 def _factorint_small(factors, n, limit, fail_max):
     """
@@ -785,7 +940,7 @@ def done(n, d):
 
 
 def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
-              verbose=False, visual=None):
+              verbose=False, visual=None, use_ecm=True, workers=None):
     r"""
     Given a positive integer ``n``, ``factorint(n)`` returns a dict containing
     the prime factors of ``n`` as keys and their respective multiplicities
@@ -898,12 +1053,21 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
     2507191691 1
     1231026625769 1
 
+    For numbers with more than 20 digits, Lenstra's elliptic curve method
+    is used as well, with growing smoothness bound.  Unlike the Pollard
+    methods, it can find factors of 20 or more digits in reasonable time.
+
     Any of these methods can optionally be disabled with the following
     boolean parameters:
 
         - ``use_trial``: Toggle use of trial division
         - ``use_rho``: Toggle use of Pollard's rho method
         - ``use_pm1``: Toggle use of Pollard's p-1 method
+        - ``use_ecm``: Toggle use of Lenstra's elliptic curve method
+
+    If ``workers`` > 1, the Pollard rho method (with different seeds)
+    and the elliptic curve method (with different curves) are run in
+    a process pool with the given number of workers.
 
     ``factorint`` also periodically checks if the remaining part is
     a prime number or a perfect power, and in those cases stops.
@@ -914,14 +1078,15 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
     See Also
     ========
 
-    smoothness, smoothness_p, divisors
+    smoothness, smoothness_p, divisors, factorint_many, ecm
 
     """
     factordict = {}
     if visual and not isinstance(n, Mul) and not isinstance(n, dict):
         factordict = factorint(n, limit=limit, use_trial=use_trial,
                                use_rho=use_rho, use_pm1=use_pm1,
-                               verbose=verbose, visual=False)
+                               verbose=verbose, visual=False,
+                               use_ecm=use_ecm, workers=workers)
     elif isinstance(n, Mul):
         factordict = {int(k): int(v) for k, v in
                       list(n.as_powers_dict().items())}
@@ -934,7 +1099,8 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
                 continue
             e = factordict.pop(k)
             d = factorint(k, limit=limit, use_trial=use_trial, use_rho=use_rho,
-                          use_pm1=use_pm1, verbose=verbose, visual=False)
+                          use_pm1=use_pm1, verbose=verbose, visual=False,
+                          use_ecm=use_ecm, workers=workers)
             for k, v in d.items():
                 if k in factordict:
                     factordict[k] += v*e
@@ -956,7 +1122,7 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
     elif isinstance(n, dict) or isinstance(n, Mul):
         return factordict
 
-    assert use_trial or use_rho or use_pm1
+    assert use_trial or use_rho or use_pm1 or use_ecm
 
     n = as_int(n)
     if limit:
@@ -966,7 +1132,8 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
     if n < 0:
         factors = factorint(
             -n, limit=limit, use_trial=use_trial, use_rho=use_rho,
-            use_pm1=use_pm1, verbose=verbose, visual=False)
+            use_pm1=use_pm1, verbose=verbose, visual=False, use_ecm=use_ecm,
+            workers=workers)
         factors[-1] = 1
         return factors
 
@@ -1021,7 +1188,8 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
             print('Exceeded limit:', limit)
 
         if _check_termination(factors, n, limit, use_trial,
-                              use_rho, use_pm1, verbose):
+                              use_rho, use_pm1, verbose, use_ecm,
+                              workers):
             if verbose:
                 print(complete_msg)
             return factors
@@ -1053,7 +1221,8 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
             for r in [a - b, a + b]:
                 facs = factorint(r, limit=limit, use_trial=use_trial,
                                  use_rho=use_rho, use_pm1=use_pm1,
-                                 verbose=verbose)
+                                 verbose=verbose, use_ecm=use_ecm,
+                                 workers=workers)
                 factors.update(facs)
             if verbose:
                 print(complete_msg)
@@ -1061,7 +1230,8 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
 
         # ...see if factorization can be terminated
         if _check_termination(factors, n, limit, use_trial,
-                              use_rho, use_pm1, verbose):
+                              use_rho, use_pm1, verbose, use_ecm,
+                              workers):
             if verbose:
                 print(complete_msg)
             return factors
@@ -1074,6 +1244,9 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
     # add 1 to make sure limit is reached in primerange calls
     limit += 1
 
+    # smoothness bound and number of curves for ECM, per worker
+    ecm_B1, ecm_curves = 2000, 10
+
     while 1:
 
         high_ = high
@@ -1088,7 +1261,8 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
             n, found_trial = _trial(factors, n, ps, verbose)
             if found_trial:
                 if _check_termination(factors, n, limit, use_trial, use_rho,
-                                      use_pm1, verbose):
+                                      use_pm1, verbose, use_ecm,
+                                      workers):
                     if verbose:
                         print(complete_msg)
                     return factors
@@ -1119,38 +1293,122 @@ def factorint(n, limit=None, use_trial=True, use_rho=True, use_pm1=True,
                                        use_trial=use_trial,
                                        use_rho=use_rho,
                                        use_pm1=use_pm1,
-                                       verbose=verbose)
+                                       verbose=verbose,
+                                       use_ecm=use_ecm,
+                                       workers=workers)
                         n, _ = _trial(factors, n, ps, verbose=False)
                         if _check_termination(factors, n, limit, use_trial,
-                                              use_rho, use_pm1, verbose):
+                                              use_rho, use_pm1, verbose,
+                                              use_ecm, workers):
                             if verbose:
                                 print(complete_msg)
                             return factors
 
-                # Pollard rho
+                # Pollard rho, with different seeds in parallel
                 if use_rho:
                     max_steps = high_root
                     if verbose:
                         print(rho_msg % (1, max_steps, high_))
-                    c = pollard_rho(n, retries=1, max_steps=max_steps,
-                                    seed=high_)
+                    c = _find_factor(n, pollard_rho,
+                                     [{'retries': 1, 'max_steps': max_steps,
+                                       'seed': high_ + i}
+                                      for i in range(workers or 1)],
+                                     workers)
                     if c:
                         # factor it and let _trial do the update
                         ps = factorint(c, limit=limit - 1,
                                        use_trial=use_trial,
                                        use_rho=use_rho,
                                        use_pm1=use_pm1,
-                                       verbose=verbose)
+                                       verbose=verbose,
+                                       use_ecm=use_ecm,
+                                       workers=workers)
                         n, _ = _trial(factors, n, ps, verbose=False)
                         if _check_termination(factors, n, limit, use_trial,
-                                              use_rho, use_pm1, verbose):
+                                              use_rho, use_pm1, verbose,
+                                              use_ecm, workers):
                             if verbose:
                                 print(complete_msg)
                             return factors
 
+            # Lenstra's ECM, with different curves in parallel, is used
+            # for numbers, that are too big for the Pollard methods
+            if use_ecm and n > ecm_min:
+                if verbose:
+                    print(ecm_msg % (ecm_B1, ecm_curves, high_))
+                c = _find_factor(n, ecm,
+                                 [{'B1': ecm_B1, 'max_curves': ecm_curves,
+                                   'seed': high_ + i}
+                                  for i in range(workers or 1)],
+                                 workers)
+                ecm_B1 = 3*ecm_B1//2
+                if c:
+                    # factor it and let _trial do the update
+                    ps = factorint(c, limit=limit - 1,
+                                   use_trial=use_trial,
+                                   use_rho=use_rho,
+                                   use_pm1=use_pm1,
+                                   verbose=verbose,
+                                   use_ecm=use_ecm,
+                                   workers=workers)
+                    n, _ = _trial(factors, n, ps, verbose=False)
+                    if _check_termination(factors, n, limit, use_trial,
+                                          use_rho, use_pm1, verbose,
+                                          use_ecm, workers):
+                        if verbose:
+                            print(complete_msg)
+                        return factors
+
         low, high = high, high*2
 
 
+def factorint_many(numbers, workers=None, **kwargs):
+    """
+    Factor integers from the iterable ``numbers``.
+
+    Yields pairs of a number and its factorization, as computed by
+    :func:`factorint` with the keyword arguments ``kwargs``.  If
+    ``workers`` > 1, numbers are factored in a process pool and
+    results come in the order of completion, not in the input order.
+
+    Examples
+    ========
+
+    >>> for n, f in factorint_many([12, 35, 101]):
+    ...     print(n, f)
+    12 {2: 2, 3: 1}
+    35 {5: 1, 7: 1}
+    101 {101: 1}
+
+    See Also
+    ========
+
+    factorint
+
+    """
+    if not workers or workers < 2:
+        for n in numbers:
+            yield n, factorint(n, **kwargs)
+        return
+
+    executor = _executor(workers)
+    numbers = iter(numbers)
+    pending = {}
+
+    def submit(count):
+        for n in itertools.islice(numbers, count):
+            pending[executor.submit(factorint, n, **kwargs)] = n
+
+    # keep all workers busy, but don't exhaust the iterable
+    submit(2*workers)
+    while pending:
+        done, _ = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED)
+        for f in done:
+            yield pending.pop(f), f.result()
+        submit(len(done))
+
+
 def factorrat(rat, limit=None, use_trial=True, use_rho=True, use_pm1=True,
               verbose=False, visual=None):
     r"""
@@ -5,17 +5,53 @@
 
 import array
 import bisect
+import itertools
 import random
 
 from ..core.compatibility import as_int
+from ..core.power import integer_nthroot, isqrt
 from .primetest import isprime
 
 
-def _arange(a, b):
-    ar = array.array('l', [0]*(b - a))
-    for i, e in enumerate(range(a, b)):
-        ar[i] = e
-    return ar
+# default size (in odd numbers) of a window of the segmented sieve
+_SEGMENT_SIZE = 2**15
+
+# the largest base prime, that the segmented sieve will use on request
+_SEGMENT_MAX_BASE = 10**6
+
+
+def _segments(a, b=None, size=_SEGMENT_SIZE):
+    """Generate pairs ``(lo, flags)`` for odd numbers in the range [a, b).
+
+    Here ``flags[i]`` is nonzero iff ``lo + 2*i`` is an odd prime.  Each
+    window covers at most ``size`` odd numbers and is sieved by primes
+    up to the square root of its upper bound, so only O(sqrt(b)) memory
+    is used.  If ``b`` is omitted, the windows continue indefinitely.
+
+    """
+    lo = max(a, 3) | 1
+    while b is None or lo < b:
+        hi = lo + 2*size if b is None else min(lo + 2*size, b)
+        n = (hi - lo + 1)//2
+        flags = bytearray(b'\x01')*n
+        for p in sieve.primerange(3, isqrt(hi - 1) + 1):
+            start = max(p*p, (lo + p - 1)//p*p)
+            if start % 2 == 0:
+                start += p
+            i = (start - lo)//2
+            if i < n:
+                flags[i::p] = bytes((n - 1 - i)//p + 1)
+        yield lo, flags
+        lo += 2*n
+
+
+def _segmented_primerange(a, b=None):
+    """Generate primes in the range [a, b) with the segmented sieve."""
+    if a <= 2 and (b is None or b > 2):
+        yield 2
+    for lo, flags in _segments(a, b):
+        for i in itertools.compress(range(len(flags)), flags):
+            yield lo + 2*i
 
 
 class Sieve:
@@ -24,6 +60,9 @@ class Sieve:
     an odd number that has not been sieved, the sieve is automatically
     extended up to that number.
 
+    New primes are found by a segmented sieve, that works on fixed-size
+    windows of odd numbers, stored in a :class:`bytearray`.
+
     >>> from array import array # this line and next for doctest only
     >>> sieve._list = array('l', [2, 3, 5, 7, 11, 13])
 
@@ -65,20 +104,9 @@ def extend(self, n):
         maxbase = int(n**0.5) + 1
         self.extend(maxbase)
 
-        # Create a new sieve starting from sqrt(n)
+        # Sieve odd numbers in the range (begin, n] window by window
         begin = self._list[-1] + 1
-        newsieve = _arange(begin, n + 1)
-
-        # Now eliminate all multiples of primes in [2, sqrt(n)]
-        for p in self.primerange(2, maxbase):
-            # Start counting at a multiple of p, offsetting
-            # the index to account for the new sieve's base index
-            startindex = (-begin) % p
-            for i in range(startindex, len(newsieve), p):
-                newsieve[i] = 0
-
-        # Merge the sieves
-        self._list += array.array('l', [x for x in newsieve if x])
+        self._list += array.array('l', _segmented_primerange(begin, n + 1))
 
     def extend_to_no(self, i):
         """Extend to include the ith prime number.
@@ -223,15 +251,29 @@ def prime(nth):
     return sieve[n]
 
 
-def primepi(n):
+def primepi(n, method=None):
     """Return the value of the prime counting function pi(n) = the number
     of prime numbers less than or equal to n.
 
+    Parameters
+    ==========
+
+    n : int
+    method : {None, 'sieve', 'lehmer'}, optional
+        Counting method.  The ``'sieve'`` method counts primes with the
+        segmented sieve, that needs O(sqrt(n)) memory, but O(n) time.
+        The ``'lehmer'`` method uses Lehmer's formula, that has
+        sublinear complexity.  By default, the ``'lehmer'`` method
+        is used for big arguments, if ``n`` isn't covered by the
+        default sieve.
+
     Examples
     ========
 
     >>> primepi(25)
     9
+    >>> primepi(10**9, method='lehmer')
+    50847534
 
     See Also
     ========
@@ -244,8 +286,92 @@ def primepi(n):
     n = int(n)
     if n < 2:
         return 0
+    if method is None:
+        if n <= sieve._list[-1]:
+            return sieve.search(n)[0]
+        method = 'sieve' if n < 2**20 else 'lehmer'
+    if method == 'sieve':
+        return 1 + sum(flags.count(1) for _, flags in _segments(3, n + 1))
+    elif method == 'lehmer':
+        return _primepi_lehmer(n)
     else:
-        return sieve.search(n)[0]
+        raise ValueError("Unknown method: %s" % method)
+
+
+def _phi_table(primes):
+    # cumulative counts of integers in [0, m], coprime to given primes
+    m = 1
+    for p in primes:
+        m *= p
+    table = array.array('l', [0]*(m + 1))
+    for i in range(1, m + 1):
+        table[i] = table[i - 1] + all(i % p for p in primes)
+    return m, table
+
+
+# Legendre's function phi(x, a) for a <= _PHI_PRIMES is computed with
+# tables, as it's periodic in x with the period p_1*...*p_a
+_PHI_PRIMES = 5
+_PHI_MODULI, _PHI_TABLES = zip(*(_phi_table(Sieve._list[:k])
+                                 for k in range(_PHI_PRIMES + 1)))
+
+
+def _primepi_lehmer(n):
+    """Count primes <= n with Lehmer's formula.
+
+    References
+    ==========
+
+    * https://en.wikipedia.org/wiki/Prime-counting_function
+    * https://mathworld.wolfram.com/LehmersFormula.html
+
+    """
+    # The default sieve covers primes up to sqrt(n), the rest of values
+    # of pi(x) for x <= n**(3/4) are computed recursively.
+    sieve.extend(isqrt(n))
+    primes = sieve._list
+    limit = primes[-1]
+    cache = {}
+
+    def pi(x):
+        if x <= limit:
+            return bisect.bisect(primes, x)
+        try:
+            return cache[x]
+        except KeyError:
+            r = cache[x] = lehmer(x)
+            return r
+
+    def phi(x, a):
+        # The number of integers in [1, x], that are not divisible
+        # by any of first a primes.
+        if a <= _PHI_PRIMES:
+            q, r = divmod(x, _PHI_MODULI[a])
+            return q*_PHI_TABLES[a][-1] + _PHI_TABLES[a][r]
+        if x <= limit and x < primes[a]**2:
+            return 1 + max(pi(x) - a, 0)
+        key = x, a
+        try:
+            return cache[key]
+        except KeyError:
+            r = cache[key] = phi(x, a - 1) - phi(x//primes[a - 1], a - 1)
+            return r
+
+    def lehmer(x):
+        a = pi(integer_nthroot(x, 4)[0])
+        b = pi(isqrt(x))
+        c = pi(integer_nthroot(x, 3)[0])
+        r = phi(x, a) + (b + a - 2)*(b - a + 1)//2
+        for i in range(a, b):
+            w = x//primes[i]
+            r -= pi(w)
+            if i < c:
+                bi = pi(isqrt(w))
+                for j in range(i, bi):
+                    r -= pi(w//primes[j]) - j
+        return r
+
+    return pi(n)
 
 
 def nextprime(n, ith=1):
@@ -273,7 +399,11 @@ def nextprime(n, ith=1):
     """
     n = int(n)
     i = as_int(ith)
-    if i > 1:
+    if i > 1 and n < _SEGMENT_MAX_BASE**2:
+        # stream primes from the segmented sieve
+        return next(itertools.islice(_segmented_primerange(n + 1),
+                                     i - 1, None))
+    elif i > 1:
         pr = n
         j = 1
         while 1:
@@ -359,7 +489,8 @@ def primerange(a, b):
 
     If the range exists in the default sieve, the values will
     be returned from there; otherwise values will be returned
-    but will not modify the sieve.
+    but will not modify the sieve.  Primes in big ranges are
+    streamed from a segmented sieve, that uses O(sqrt(b)) memory.
 
     Notes
     =====
@@ -423,8 +554,15 @@ def primerange(a, b):
         return
     # wrapping ceiling in int will raise an error if there was a problem
     # determining whether the expression was exactly an integer or not
-    a = int(ceiling(a)) - 1
+    a = int(ceiling(a))
     b = int(ceiling(b))
+    # use the segmented sieve, unless the base primes are too expensive
+    # for the given range
+    r = isqrt(b - 1)
+    if r <= max(sieve._list[-1], min(4*(b - a), _SEGMENT_MAX_BASE)):
+        yield from _segmented_primerange(a, b)
+        return
+    a -= 1
     while 1:
         a = nextprime(a)
         if a < b:
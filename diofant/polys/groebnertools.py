@@ -1,9 +1,14 @@
 """Gröbner bases algorithms. """
 
+import concurrent.futures
+
 from ..core import Dummy
+from ..domains import FF, ZZ
+from ..ntheory import nextprime
 from .monomials import Monomial
-from .orderings import lex
+from .orderings import grevlex, grlex, lex
 from .polyconfig import query
+from .rings import PolynomialRing
 
 
 def groebner(seq, ring, method=None):
@@ -13,7 +18,8 @@ def groebner(seq, ring, method=None):
     Wrapper around the (default) improved Buchberger and the other algorithms
     for computing Gröbner bases. The choice of algorithm can be changed via
     ``method`` argument or :func:`~diofant.polys.polyconfig.setup`,
-    where ``method`` can be either ``buchberger`` or ``f5b``.
+    where ``method`` can be either ``buchberger``, ``f5b``, ``f4``
+    or ``modular``.
 
     """
     if method is None:
@@ -22,12 +28,14 @@ def groebner(seq, ring, method=None):
     _groebner_methods = {
         'buchberger': buchberger,
         'f5b': f5b,
+        'f4': f4,
+        'modular': modgroebner,
     }
 
     try:
         _groebner = _groebner_methods[method]
     except KeyError:
-        raise ValueError("'%s' is not a valid Gröbner bases algorithm (valid are 'buchberger' and 'f5b')" % method)
+        raise ValueError("'%s' is not a valid Gröbner bases algorithm (valid are 'buchberger', 'f5b', 'f4' and 'modular')" % method)
 
     domain, orig = ring.domain, None
 
@@ -103,75 +111,6 @@ def normal(g, J):
 
             return h.LM, I[h]
 
-    def update(G, B, ih):
-        # update G using the set of critical pairs B and h
-        # [BW] page 230
-        h = f[ih]
-        mh = h.LM
-
-        # filter new pairs (h, g), g in G
-        C = G.copy()
-        D = set()
-
-        while C:
-            # select a pair (h, g) by popping an element from C
-            ig = C.pop()
-            g = f[ig]
-            mg = g.LM
-            LCMhg = mh.lcm(mg)
-
-            def lcm_divides(ip):
-                # LCM(LM(h), LM(p)) divides LCM(LM(h), LM(g))
-                m = mh.lcm(f[ip].LM)
-                return m.divides(LCMhg)
-
-            # HT(h) and HT(g) disjoint: mh*mg == LCMhg
-            if mh*mg == LCMhg or (
-                not any(lcm_divides(ipx) for ipx in C) and
-                    not any(lcm_divides(pr[1]) for pr in D)):
-                D.add((ih, ig))
-
-        E = set()
-
-        while D:
-            # select h, g from D (h the same as above)
-            ih, ig = D.pop()
-            mg = f[ig].LM
-            LCMhg = mh.lcm(mg)
-
-            if not mh*mg == LCMhg:
-                E.add((ih, ig))
-
-        # filter old pairs
-        B_new = set()
-
-        while B:
-            # select g1, g2 from B (-> CP)
-            ig1, ig2 = B.pop()
-            mg1 = f[ig1].LM
-            mg2 = f[ig2].LM
-            LCM12 = mg1.lcm(mg2)
-
-            # if HT(h) does not divide lcm(HT(g1), HT(g2))
-            if not mh.divides(LCM12) or mg1.lcm(mh) == LCM12 or mg2.lcm(mh) == LCM12:
-                B_new.add((ig1, ig2))
-
-        B_new |= E
-
-        # filter polynomials
-        G_new = set()
-
-        while G:
-            ig = G.pop()
-            mg = f[ig].LM
-
-            if not mh.divides(mg):
-                G_new.add(ig)
-
-        G_new.add(ih)
-
-        return G_new, B_new
-        # end of update ################################
 
     if not f:
         return []
@@ -210,7 +149,7 @@ def lcm_divides(ip):
         h = min((f[x] for x in F), key=lambda f: order(f.LM))
         ih = I[h]
         F.remove(ih)
-        G, CP = update(G, CP, ih)
+        G, CP = _update(f, G, CP, ih)
 
     # count the number of critical pairs which reduce to zero
     reductions_to_zero = 0
@@ -225,7 +164,7 @@ def lcm_divides(ip):
         ht = normal(h, G1)
 
         if ht:
-            G, CP = update(G, CP, ht[1])
+            G, CP = _update(f, G, CP, ht[1])
         else:
             reductions_to_zero += 1
 
@@ -247,6 +186,389 @@ def lcm_divides(ip):
     return Gr
 
 
+def _update(f, G, B, ih):
+    """
+    Update the set ``G`` of indices of basis polynomials and the
+    set ``B`` of critical pairs with the new polynomial ``f[ih]``.
+
+    Pairs, that can be discarded by Buchberger's criteria, are
+    removed (Gebauer-Möller installation, [BW] page 230).
+
+    """
+    h = f[ih]
+    mh = h.LM
+
+    # filter new pairs (h, g), g in G
+    C = G.copy()
+    D = set()
+
+    while C:
+        # select a pair (h, g) by popping an element from C
+        ig = C.pop()
+        g = f[ig]
+        mg = g.LM
+        LCMhg = mh.lcm(mg)
+
+        def lcm_divides(ip):
+            # LCM(LM(h), LM(p)) divides LCM(LM(h), LM(g))
+            m = mh.lcm(f[ip].LM)
+            return m.divides(LCMhg)
+
+        # HT(h) and HT(g) disjoint: mh*mg == LCMhg
+        if mh*mg == LCMhg or (
+            not any(lcm_divides(ipx) for ipx in C) and
+                not any(lcm_divides(pr[1]) for pr in D)):
+            D.add((ih, ig))
+
+    E = set()
+
+    while D:
+        # select h, g from D (h the same as above)
+        ih, ig = D.pop()
+        mg = f[ig].LM
+        LCMhg = mh.lcm(mg)
+
+        if not mh*mg == LCMhg:
+            E.add((ih, ig))
+
+    # filter old pairs
+    B_new = set()
+
+    while B:
+        # select g1, g2 from B (-> CP)
+        ig1, ig2 = B.pop()
+        mg1 = f[ig1].LM
+        mg2 = f[ig2].LM
+        LCM12 = mg1.lcm(mg2)
+
+        # if HT(h) does not divide lcm(HT(g1), HT(g2))
+        if not mh.divides(LCM12) or mg1.lcm(mh) == LCM12 or mg2.lcm(mh) == LCM12:
+            B_new.add((ig1, ig2))
+
+    B_new |= E
+
+    # filter polynomials
+    G_new = set()
+
+    while G:
+        ig = G.pop()
+        mg = f[ig].LM
+
+        if not mh.divides(mg):
+            G_new.add(ig)
+
+    G_new.add(ih)
+
+    return G_new, B_new
+
+
+def f4(f, ring):
+    """
+    Computes a reduced Gröbner basis for the ideal generated by f.
+
+    f4 is an implementation of the F4 algorithm of J.-C. Faugère.
+    Instead of reducing one S-polynomial at a time, all critical
+    pairs of the minimal degree are selected at once.  Their halves
+    and all needed reducers (found by the symbolic preprocessing)
+    form rows of a sparse Macaulay matrix, columns of which are
+    indexed by monomials in the decreasing order.  Rows with new
+    leading monomials after the row echelon reduction of this matrix
+    are adjoined to the basis.
+
+    Critical pairs are managed by the same criteria as in
+    :func:`buchberger`.  The ground domain must be a field.
+
+    References
+    ==========
+
+    * :cite:`Faugere1999f4`
+    * :cite:`Cox2015ideals`, chapter 10
+
+    Examples
+    ========
+
+    >>> R, x, y = ring("x y", QQ, lex)
+    >>> f4([x**2 + y**2 - 1, x - y], R)
+    [x - y, y**2 - 1/2]
+
+    """
+    order = ring.order
+    domain = ring.domain
+
+    if not f:
+        return []
+
+    # replace f with a reduced list of initial polynomials; see [BW] page 203
+    f1 = f[:]
+
+    while True:
+        f = f1[:]
+        f1 = []
+
+        for i in range(len(f)):
+            p = f[i]
+            r = p.div(f[:i])[1]
+
+            if r:
+                f1.append(r.monic())
+
+        if f == f1:
+            break
+
+    G = set()         # set of indices of intermediate would-be Gröbner basis
+    CP = set()        # set of pairs of indices of critical pairs
+
+    for ih in sorted(range(len(f)), key=lambda i: order(f[i].LM)):
+        G, CP = _update(f, G, CP, ih)
+
+    # normal strategy: for degree orderings select all pairs with
+    # lcm of minimal total degree, else pairs with minimal lcm
+    if order in (grlex, grevlex):
+        degree = sum
+    else:
+        degree = order
+
+    LM = [g.LM for g in f]
+
+    while CP:
+        lcms = {pair: LM[pair[0]].lcm(LM[pair[1]]) for pair in CP}
+        d = min(degree(m) for m in lcms.values())
+        pairs = {pair for pair, m in lcms.items() if degree(m) == d}
+        CP -= pairs
+
+        # both halves of S-polynomials
+        rows = {}
+        for pair in pairs:
+            for ig in pair:
+                m = lcms[pair]/LM[ig]
+                rows[(m, ig)] = f[ig].mul_monom(m)
+        rows = list(rows.values())
+
+        # symbolic preprocessing: add reducers for all reducible monomials
+        basis = sorted(G, key=lambda g: order(LM[g]))
+        reducers = []
+        done = {p.LM for p in rows}
+        todo = set().union(*rows) - done
+
+        while todo:
+            m = todo.pop()
+            done.add(m)
+
+            for ig in basis:
+                if LM[ig].divides(m):
+                    r = f[ig].mul_monom(m/LM[ig])
+                    reducers.append(r)
+                    todo |= set(r) - done
+                    break
+
+        monoms = sorted(done, key=order, reverse=True)
+
+        for h in _f4_reduce(rows, reducers, monoms, domain):
+            f.append(ring.from_dict(h))
+            LM.append(f[-1].LM)
+            G, CP = _update(f, G, CP, len(f) - 1)
+
+    # now G is a Gröbner basis; reduce it
+    Gr = red_groebner([f[ig] for ig in G], ring)
+
+    return sorted(Gr, key=lambda f: order(f.LM), reverse=True)
+
+
+def _f4_reduce(rows, reducers, monoms, domain):
+    """
+    Sparse row echelon form of the Macaulay matrix for :func:`f4`.
+
+    Columns are indexed by ``monoms``.  Polynomials in ``reducers``
+    have distinct monic leading terms, that are not leading terms of
+    ``rows``.  Returns list of dictionaries for reduced ``rows`` with
+    new leading monomials, normalized to have leading coefficient one.
+
+    """
+    # for prime fields, use integers, that are much faster than
+    # elements of the domain
+    if domain.is_FiniteField and domain.order == domain.mod:
+        p, zero, convert = int(domain.mod), 0, int
+    else:
+        p, zero, convert = None, domain.zero, lambda c: c
+
+    index = {m: i for i, m in enumerate(monoms)}
+    pivots = {index[r.LM]: {index[m]: convert(c) for m, c in r.items()}
+              for r in reducers}
+    leads = {index[f.LM] for f in rows}
+
+    def reduce(row, start=0):
+        # eliminate entries in pivot columns, from left to right
+        while True:
+            cols = [c for c in row if c in pivots and c >= start]
+
+            if not cols:
+                return row
+
+            c = min(cols)
+            coeff = row[c]
+
+            for k, v in pivots[c].items():
+                v = row.get(k, zero) - coeff*v
+
+                if p:
+                    v %= p
+
+                if v:
+                    row[k] = v
+                else:
+                    del row[k]
+
+    new = []
+
+    # sparsest rows first
+    for f in sorted(rows, key=len):
+        row = reduce({index[m]: convert(c) for m, c in f.items()})
+
+        if row:
+            c = min(row)
+
+            if p:
+                lc = pow(row[c], -1, p)
+                pivots[c] = {k: v*lc % p for k, v in row.items()}
+            else:
+                lc = domain.one/row[c]
+                pivots[c] = {k: v*lc for k, v in row.items()}
+
+            if c not in leads:
+                new.append(c)
+
+    result = []
+
+    for c in new:
+        row = reduce(pivots[c], c + 1)
+        result.append({monoms[k]: v for k, v in row.items()})
+
+    return result
+
+
+def _groebner_mod_p(F, symbols, order, p):
+    """Compute reduced Gröbner basis of ``F`` over `GF(p)`.
+
+    Polynomials are given and returned as dictionaries with integer
+    coefficients, so this can be used in a process pool.
+
+    """
+    ring = PolynomialRing(FF(p), symbols, order)
+    G = f4([ring.from_dict(f) for f in F], ring)
+    return [{m: int(c) for m, c in g.items()} for g in G]
+
+
+def modgroebner(F, ring):
+    r"""
+    Computes a reduced Gröbner basis for the ideal generated by F
+    using a multi-modular algorithm.
+
+    Reduced Gröbner bases of the integer generators are computed
+    with :func:`f4` over `GF(p)` for several primes `p`, that don't
+    divide leading coefficients of generators.  Bases with the same
+    leading monomials are combined by the Chinese Remainder Theorem.
+    Primes with leading monomials, that are different from these of
+    the majority of primes, are considered unlucky and discarded.
+    Rational reconstruction of coefficients is attempted after each
+    batch of primes and, once it's stable, the result is certified
+    by :func:`is_groebner` and the ideal membership test for ``F``.
+
+    The ground domain must be `\mathbb{Q}`, other domains are
+    handled by :func:`f4`.  Primes are processed by a process pool if
+    the ``GROEBNER_WORKERS`` option of
+    :mod:`~diofant.polys.polyconfig` is greater than one.
+
+    References
+    ==========
+
+    * :cite:`Arnold2003modular`
+    * :cite:`Idrees2011parallel`
+
+    Examples
+    ========
+
+    >>> R, x, y = ring("x y", QQ, lex)
+    >>> modgroebner([x**2 + y**2 - 1, 2*x - 3*y], R)
+    [x - 3/2*y, y**2 - 4/13]
+
+    """
+    from .modulargcd import (_chinese_remainder_reconstruction,
+                             _rational_reconstruction_int_coeffs)
+
+    order = ring.order
+    domain = ring.domain
+
+    if not domain.is_RationalField:
+        return f4(F, ring)
+
+    F = [f for f in F if f]
+
+    if not F:
+        return []
+
+    zzring = ring.clone(domain=ZZ)
+    F = [f.clear_denoms()[1].set_ring(zzring) for f in F]
+    LCs = [f.LC for f in F]
+    F = [dict(f) for f in F]
+
+    workers = query('GROEBNER_WORKERS')
+
+    if workers > 1:
+        executor = concurrent.futures.ProcessPoolExecutor(workers)
+        batch = workers
+    else:
+        executor = None
+        batch = 1
+
+    groups = {}  # leading monomials -> [modulus, basis]
+    last = None
+    p = 2**31
+
+    try:
+        while True:
+            primes = []
+
+            while len(primes) < batch:
+                p = nextprime(p)
+
+                if all(lc % p for lc in LCs):
+                    primes.append(p)
+
+            args = [(F, ring.symbols, order, p) for p in primes]
+
+            if executor is not None:
+                bases = executor.map(_groebner_mod_p, *zip(*args))
+            else:
+                bases = [_groebner_mod_p(*a) for a in args]
+
+            for p, G in zip(primes, bases):
+                G = [zzring.from_dict(g) for g in G]
+                key = tuple(g.LM for g in G)
+
+                if key not in groups:
+                    groups[key] = [p, G]
+                else:
+                    m, Gm = groups[key]
+                    Gm = [_chinese_remainder_reconstruction(gm, g, m, p)
+                          for gm, g in zip(Gm, G)]
+                    groups[key] = [m*p, Gm]
+
+            # majority vote against unlucky primes
+            m, Gm = max(groups.values(), key=lambda v: v[0])
+            G = [_rational_reconstruction_int_coeffs(g, m, ring) for g in Gm]
+
+            if any(g is None for g in G) or G != last:
+                last = G
+                continue
+
+            if is_groebner(G) and all(not f.div(G)[1] for f in
+                                      [ring.from_dict(f) for f in F]):
+                return G
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
 def spoly(p1, p2):
     """
     Compute LCM(LM(p1), LM(p2))/LM(p1)*p1 - LCM(LM(p1), LM(p2))/LM(p2)*p2.
@@ -676,12 +998,21 @@ def reduction(P):
 
 def is_groebner(G):
     """Check if G is a Gröbner basis."""
-    for i in range(len(G)):
-        for j in range(i + 1, len(G)):
-            s = spoly(G[i], G[j])
-            s = s.div(G)[1]
-            if s:
-                return False
+    order = G[0].ring.order if G else None
+
+    if all(not f.LM.divides(g.LM) for f in G for g in G if f is not g):
+        # critical pairs, that survive Buchberger's criteria
+        I, B = set(), set()
+        for i in sorted(range(len(G)), key=lambda i: order(G[i].LM)):
+            I, B = _update(G, I, B, i)
+    else:
+        B = {(i, j) for i in range(len(G)) for j in range(i + 1, len(G))}
+
+    for i, j in B:
+        s = spoly(G[i], G[j])
+        s = s.div(G)[1]
+        if s:
+            return False
 
     return True
 
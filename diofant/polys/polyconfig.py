@@ -31,6 +31,7 @@
     'AA_FACTOR_METHOD':           'trager',
 
     'GROEBNER':                   'buchberger',
+    'GROEBNER_WORKERS':           0,
     'MINPOLY_METHOD':             'compose',
 
     'KARATSUBA_CUTOFF':           100,
@@ -4779,7 +4779,7 @@ def groebner(F, *gens, **args):
 
         order : str, optional
             Monomial order, defaults to ``lex``.
-        method : {'buchberger', 'f5b'}, optional
+        method : {'buchberger', 'f5b', 'f4', 'modular'}, optional
             Set algorithm to compute Gröbner basis.  By default, an improved
             implementation of the Buchberger algorithm is used.
         field : bool, optional
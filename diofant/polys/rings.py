@@ -1,6 +1,7 @@
 """Sparse polynomial rings. """
 
 import functools
+import heapq
 import math
 import operator
 
@@ -21,7 +22,7 @@
 from .heuristicgcd import heugcd
 from .modulargcd import func_field_modgcd, modgcd
 from .monomials import Monomial
-from .orderings import lex
+from .orderings import grevlex, grlex, lex
 from .polyconfig import query
 from .polyerrors import (CoercionFailed, ExactQuotientFailed, GeneratorsError,
                          GeneratorsNeeded, HeuristicGCDFailed,
@@ -36,7 +37,7 @@
 __all__ = 'PolynomialRing', 'ring', 'sring', 'vring'
 
 
-def ring(symbols, domain, order=lex):
+def ring(symbols, domain, order=lex, repr='dict'):
     """Construct a polynomial ring returning ``(ring, x_1, ..., x_n)``.
 
     Parameters
@@ -45,6 +46,7 @@ def ring(symbols, domain, order=lex):
     symbols : str, Symbol/Expr or sequence of str, Symbol/Expr (non-empty)
     domain : :class:`~diofant.domains.domain.Domain` or coercible
     order : :class:`~diofant.polys.polyoptions.Order` or coercible, optional, defaults to ``lex``
+    repr : str, optional, ``'dict'`` (default) or ``'packed'``, see :class:`PolynomialRing`
 
     Examples
     ========
@@ -56,11 +58,11 @@ def ring(symbols, domain, order=lex):
     x + y + z
 
     """
-    _ring = PolynomialRing(domain, symbols, order)
+    _ring = PolynomialRing(domain, symbols, order, repr)
     return (_ring,) + _ring.gens
 
 
-def vring(symbols, domain, order=lex):
+def vring(symbols, domain, order=lex, repr='dict'):
     """Construct a polynomial ring and inject ``x_1, ..., x_n`` into the global namespace.
 
     Parameters
@@ -69,6 +71,7 @@ def vring(symbols, domain, order=lex):
     symbols : str, Symbol/Expr or sequence of str, Symbol/Expr (non-empty)
     domain : :class:`~diofant.domains.domain.Domain` or coercible
     order : :class:`~diofant.polys.polyoptions.Order` or coercible, optional, defaults to ``lex``
+    repr : str, optional, ``'dict'`` (default) or ``'packed'``, see :class:`PolynomialRing`
 
     Examples
     ========
@@ -79,7 +82,7 @@ def vring(symbols, domain, order=lex):
     x + y + z
 
     """
-    _ring = PolynomialRing(domain, symbols, order)
+    _ring = PolynomialRing(domain, symbols, order, repr)
     pollute([sym.name for sym in _ring.symbols], _ring.gens)
     return _ring
 
@@ -153,20 +156,33 @@ def _parse_symbols(symbols):
 
 
 class PolynomialRing(Ring, CompositeDomain, IPolys):
-    """A class for representing multivariate polynomial rings."""
+    """A class for representing multivariate polynomial rings.
+
+    Polynomials are stored as dictionaries, mapping exponent vectors
+    to coefficients.  For ``repr='packed'``, multiplication and division
+    of polynomials pack exponent vectors into single integers, so
+    monomial multiplication becomes an integer addition (with
+    overflow check) and the division algorithm selects leading
+    terms from a heap.  Packing is supported for
+    ``lex``, ``grlex`` and ``grevlex`` orders.
+
+    """
 
     is_PolynomialRing = is_Poly = True
 
     has_assoc_Ring = True
     has_assoc_Field = True
 
-    def __new__(cls, domain, symbols, order=lex):
+    def __new__(cls, domain, symbols, order=lex, repr='dict'):
         symbols = tuple(_parse_symbols(symbols))
         ngens = len(symbols)
         domain = DomainOpt.preprocess(domain)
         order = OrderOpt.preprocess(order)
 
-        _hash = hash((cls.__name__, symbols, ngens, domain, order))
+        if repr not in ('dict', 'packed'):
+            raise ValueError("expected 'dict' or 'packed' representation, got %s" % repr)
+
+        _hash = hash((cls.__name__, symbols, ngens, domain, order, repr))
         obj = _ring_cache.get(_hash)
 
         if obj is None:
@@ -175,11 +191,14 @@ def __new__(cls, domain, symbols, order=lex):
 
             obj = object.__new__(cls)
             obj._hash = _hash
-            obj.dtype = type("PolyElement", (PolyElement,), {"ring": obj})
+            base = PackedPolyElement if repr == 'packed' else PolyElement
+            obj.dtype = type("PolyElement", (base,), {"ring": obj})
             obj.symbols = symbols
             obj.ngens = ngens
             obj.domain = domain
             obj.order = order
+            obj.repr = repr
+            obj._packings = {}
 
             obj.zero_monom = Monomial((0,)*ngens)
             obj.gens = obj._gens()
@@ -220,7 +239,74 @@ def __eq__(self, other):
         return self is other
 
     def clone(self, symbols=None, domain=None, order=None):
-        return self.__class__(domain or self.domain, symbols or self.symbols, order or self.order)
+        return self.__class__(domain or self.domain, symbols or self.symbols,
+                              order or self.order, self.repr)
+
+    def _pack_bits(self, *polys):
+        """Return field width, enough to pack products of ``polys``."""
+        bound = 0
+        for f in polys:
+            bound += max(max(sum(m), max(m, default=0)) for m in f)
+        return bound.bit_length() + 1
+
+    def _packing(self, bits):
+        """Return helpers for exponent vectors, packed into ``bits`` wide fields.
+
+        Returns a tuple ``(pack, unpack, key, guard)``, where ``key``
+        maps packed monomials to sort keys, that are smallest for
+        the greatest monomials in the ring order, and
+        ``guard`` is a mask of the highest bits of all fields, which
+        is used to detect overflows and failed monomial divisions.
+
+        """
+        try:
+            return self._packings[bits]
+        except KeyError:
+            pass
+
+        ngens, order = self.ngens, self.order
+        mask = (1 << bits) - 1
+        nfields = ngens + (order != lex)
+        guard = sum(1 << (bits*(i + 1) - 1) for i in range(nfields))
+        shift = bits*ngens
+        low = (1 << shift) - 1
+
+        if order == lex:
+            def fields(m):
+                return m
+        elif order == grlex:
+            def fields(m):
+                return (sum(m),) + tuple(m)
+        elif order == grevlex:
+            def fields(m):
+                return (sum(m),) + tuple(reversed(m))
+        else:
+            raise NotImplementedError("can't pack monomials for %s order" % order)
+
+        def pack(m):
+            k = 0
+            for e in fields(m):
+                k = (k << bits) | e
+            return k
+
+        def unpack(k):
+            m = []
+            for _ in range(ngens):
+                m.append(k & mask)
+                k >>= bits
+            if order != grevlex:
+                m.reverse()
+            return Monomial(m)
+
+        if order == grevlex:
+            def key(k):
+                return -(k >> shift), k & low
+        else:
+            def key(k):
+                return -k
+
+        self._packings[bits] = r = pack, unpack, key, guard
+        return r
 
     def monomial_basis(self, i):
         """Return the ith-basis element."""
@@ -2177,3 +2263,143 @@ def slice(self, m, n, x=0):
         ring = self.ring
         j = ring.index(x)
         return ring.dmp_slice_in(self, m, n, j)
+
+
+class _PackedOverflow(Exception):
+    pass
+
+
+class PackedPolyElement(PolyElement):
+    """Element of polynomial ring with packed exponent vectors.
+
+    See Also
+    ========
+
+    PolynomialRing
+
+    """
+
+    def _from_packed(self, terms, unpack):
+        p = self.ring.zero
+        for k, v in terms.items():
+            if v:
+                dict.__setitem__(p, unpack(k), v)
+        return p
+
+    def __mul__(self, other):
+        """Multiply two polynomials.
+
+        Examples
+        ========
+
+        >>> _, x, y = ring('x, y', QQ, repr='packed')
+        >>> (x + y)*(x - y)
+        x**2 - y**2
+
+        """
+        ring = self.ring
+        if (not isinstance(other, ring.dtype) or not self or not other or
+                ring.order not in (lex, grlex, grevlex)):
+            return super().__mul__(other)
+
+        pack, unpack, _, _ = ring._packing(ring._pack_bits(self, other))
+        f = [(pack(m), c) for m, c in self.items()]
+        g = [(pack(m), c) for m, c in other.items()]
+        terms = {}
+        get = terms.get
+        zero = ring.domain.zero
+        for k1, c1 in f:
+            for k2, c2 in g:
+                k = k1 + k2
+                terms[k] = get(k, zero) + c1*c2
+        return self._from_packed(terms, unpack)
+
+    def _square(self):
+        return self*self
+
+    def div(self, fv):
+        """Division algorithm, see :cite:`Cox2015ideals`, p. 64.
+
+        Leading terms of the dividend are selected from a heap of
+        packed monomials, which is restarted with wider fields
+        if exponents overflow.
+
+        Examples
+        ========
+
+        >>> _, x, y = ring('x, y', ZZ, repr='packed')
+        >>> (x**3).div([x - y**2, x - y])
+        ([x**2 + x*y**2 + y**4, 0], y**6)
+
+        """
+        ring = self.ring
+        if any(not f for f in fv):
+            raise ZeroDivisionError("polynomial division")
+        if any(f.ring != ring for f in fv):
+            raise ValueError('self and f must have the same ring')
+        if not self:
+            return [ring.zero], ring.zero
+        if ring.order not in (lex, grlex, grevlex):
+            return super().div(fv)
+
+        bits = ring._pack_bits(self, *fv)
+        while True:
+            try:
+                return self._div_packed(fv, bits)
+            except _PackedOverflow:
+                bits *= 2
+
+    def _div_packed(self, fv, bits):
+        ring = self.ring
+        domain = ring.domain
+        zero = domain.zero
+        pack, unpack, key, guard = ring._packing(bits)
+
+        p = {pack(m): c for m, c in self.items()}
+        heap = [(key(k), k) for k in p]
+        heapq.heapify(heap)
+
+        fs = [[(pack(m), c) for m, c in f.items()] for f in fv]
+        lms = [pack(f.leading_expv()) for f in fv]
+        lcs = [f.LC for f in fv]
+        qv = [{} for f in fv]
+        r = {}
+
+        while heap:
+            _, k = heapq.heappop(heap)
+            c = p.get(k)
+            if c is None:
+                continue
+            for i, lm in enumerate(lms):
+                t = (k | guard) - lm
+                if t & guard != guard:
+                    continue
+                t -= guard
+                lc = lcs[i]
+                if not domain.is_Field and c % lc:
+                    continue
+                cq = domain.quo(c, lc)
+                qv[i][t] = cq
+                for fk, fc in fs[i]:
+                    nk = fk + t
+                    if nk & guard:
+                        raise _PackedOverflow
+                    v = p.get(nk)
+                    if v is None:
+                        p[nk] = -fc*cq
+                        heapq.heappush(heap, (key(nk), nk))
+                    else:
+                        v -= fc*cq
+                        if v:
+                            p[nk] = v
+                        else:
+                            del p[nk]
+                if k in p:
+                    raise PolynomialDivisionFailed(self, fv[i], ring)
+                break
+            else:
+                r[k] = c
+                del p[k]
+
+        return ([self._from_packed(q, unpack) for q in qv],
+                self._from_packed(r, unpack))
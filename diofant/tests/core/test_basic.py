@@ -3,10 +3,13 @@
 """
 
 import collections
+import gc
 
 import pytest
 
-from diofant import I, Lambda, cos, exp, gamma, sin
+import diofant
+from diofant import (Add, Float, I, Integer, Lambda, Mul, Pow, Symbol, cos,
+                     exp, gamma, sin)
 from diofant.abc import w, x, y, z
 from diofant.core.basic import Atom, Basic, preorder_traversal
 from diofant.core.compatibility import default_sort_key
@@ -214,3 +217,37 @@ def test_literal_evalf_is_number_is_zero_is_comparable():
     n = sin(1)**2 + cos(1)**2 - 1
     assert n.is_comparable is not True
     assert n.evalf(2, strict=False).is_comparable is not True
+
+
+def test_intern(monkeypatch):
+    monkeypatch.setattr(diofant.core.basic, 'USE_INTERN', True)
+
+    e1 = Add(Pow(x, 2, evaluate=False), Mul(3, y, evaluate=False),
+             evaluate=False)
+    e2 = Add(Pow(x, 2, evaluate=False), Mul(3, y, evaluate=False),
+             evaluate=False)
+    assert e1 is e2
+    assert e1._interned is True
+
+    # atoms are compared strictly
+    e3 = Add(x, Float(3), evaluate=False)
+    assert e3 is not Add(x, Integer(3), evaluate=False)
+    assert e3 is Add(x, Float(3), evaluate=False)
+
+    # only expressions with interned arguments are interned
+    i = Integral(x, (x, 0, 1))
+    e4 = Add(i, y, evaluate=False)
+    assert e4._interned is False
+    assert e4 is not Add(i, y, evaluate=False)
+
+    assert sin(e1) is sin(e2)
+
+    key = (Add, (Symbol, 'x', ('commutative', True)), (Integer, 5, 1))
+    e5 = Add(x, 5, evaluate=False)
+    assert diofant.core.basic.INTERN[key] is e5
+    del e5
+    gc.collect()
+    assert key not in diofant.core.basic.INTERN
+
+    monkeypatch.setattr(diofant.core.basic, 'USE_INTERN', False)
+    assert Add(x, y, evaluate=False) is not Add(x, y, evaluate=False)
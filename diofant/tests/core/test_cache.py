@@ -4,8 +4,10 @@
 
 import pytest
 
+import diofant
 from diofant.abc import x
-from diofant.core.cache import cacheit, clear_cache, print_cache
+from diofant.core.cache import (CACHE, cache_stats, cacheit, clear_cache,
+                                 print_cache, set_cache_policy, set_cache_size)
 from diofant.core.compatibility import ordered
 from diofant.core.symbol import symbols
 from diofant.printing.str import sstr
@@ -38,7 +40,7 @@ def test_cacheit():
 def test_print_cache(capfd):
     clear_cache()
     _identity(x)
-    info = _identity.cache_info()
+    info = cache_stats()['_identity']
     print_cache()
     resout, _ = capfd.readouterr()
     assert resout.find('_identity ' + str(info)) >= 0
@@ -114,3 +116,134 @@ def test_sympyissue_8825():
     clear_cache()
     gc.collect()
     assert sstr(list(ordered(d.items()))) == '[(t2, 2)]'
+
+
+@pytest.fixture
+def restore_cache_settings():
+    size, policy = diofant.core.cache.CACHE_SIZE, diofant.core.cache.CACHE_POLICY
+    yield
+    set_cache_size(size)
+    set_cache_policy(policy)
+
+
+def test_cache_size(restore_cache_settings):
+    @cacheit
+    def f(a):
+        return a
+
+    set_cache_size(3, f)
+    assert f.cache_local_size is True
+    for i in range(5):
+        assert f(i) == i
+    assert f.cache_info() == (0, 5, 3, 3, 2)
+    assert f(4) == 4
+    assert f(2) == 2
+    assert f(5) == 5  # evicts f(3)
+    assert f.cache_info() == (2, 6, 3, 3, 3)
+    assert f(3) == 3
+    assert f.cache_info().misses == 7
+
+    set_cache_size(1)
+    assert f.cache_info().maxsize == 3
+
+    set_cache_size(None, f)
+    assert f.cache_local_size is False
+    assert f.cache_info().maxsize == 1
+
+    set_cache_size(None)
+    assert f.cache_info() == (0, 0, None, 0, 0)
+
+    g = cacheit(lambda a: a, maxsize=2)
+    assert g.cache_info().maxsize == 2
+    set_cache_size(5)
+    assert g.cache_info().maxsize == 2
+
+    pytest.raises(ValueError, lambda: set_cache_size(-1))
+    pytest.raises(ValueError, lambda: set_cache_size(-1, g))
+    pytest.raises(ValueError, lambda: cacheit(lambda a: a, maxsize=-1))
+    assert g.cache_info().maxsize == 2
+
+    # failed calls and recursion are not counted as evictions
+    @cacheit
+    def h(a):
+        if a < 0:
+            raise ValueError
+        return h(a - 1) + 1 if a else 0
+
+    for policy in ('lru', 'lfu'):
+        set_cache_size(2, h)
+        set_cache_policy(policy, h)
+        pytest.raises(ValueError, lambda: h(-1))
+        pytest.raises(ValueError, lambda: h(-2))
+        assert h.cache_info() == (0, 2, 2, 0, 0)
+        assert h(1) == 1
+        assert h.cache_info() == (0, 4, 2, 2, 0)
+        assert h(2) == 2
+        assert h.cache_info().evictions == 1
+
+        set_cache_size(0, h)
+        assert h(1) == h(1) == 1
+        assert h.cache_info() == (0, 4, 0, 0, 0)
+
+
+def test_cache_policy(restore_cache_settings):
+    @cacheit
+    def f(a, b=0):
+        return a + b
+
+    pytest.raises(ValueError, lambda: set_cache_policy('spam'))
+    pytest.raises(ValueError, lambda: set_cache_policy('spam', f))
+    pytest.raises(ValueError, lambda: cacheit(f, policy='spam'))
+    assert f.cache_local_policy is False
+
+    set_cache_policy('lfu', f)
+    assert f.cache_policy == 'lfu'
+    assert f.cache_local_policy is True
+    set_cache_size(2, f)
+    assert f(1) == f(1) == f(1) == 1
+    assert f(2) == 2
+    assert f(3) == 3  # evicts f(2)
+    assert f.cache_info() == (2, 3, 2, 2, 1)
+    assert f(1) == 1
+    assert f(2) == 2  # evicts f(3)
+    assert f.cache_info() == (3, 4, 2, 2, 2)
+    assert f(1, b=1) == f(1, b=1) == 2
+    assert f(1, 1) == 2
+    assert f.cache_info().hits == 4
+
+    # unhashable arguments
+    assert f([1], b=[2]) == [1, 2]
+
+    f.cache_clear()
+    assert f.cache_info() == (0, 0, 2, 0, 0)
+
+    g = cacheit(lambda a: a, policy='lfu')
+    assert g.cache_local_policy is True
+
+    # global policy keeps local ones
+    set_cache_policy('lru')
+    assert f.cache_policy == g.cache_policy == 'lfu'
+    set_cache_policy(None, f)
+    assert f.cache_policy == 'lru'
+    assert f.cache_local_policy is False
+
+    set_cache_policy('lfu')
+    assert all(item.cache_policy == 'lfu' for item in CACHE
+               if not item.cache_local_policy)
+    assert symbols('x') + 1 == x + 1
+    set_cache_policy('lru')
+    assert all(item.cache_policy == 'lru' for item in CACHE
+               if not item.cache_local_policy)
+    assert g.cache_policy == 'lfu'
+
+
+def test_cache_stats():
+    clear_cache()
+    _identity(x)
+    _identity(x)
+    stats = cache_stats()
+    maxsize = diofant.core.cache.CACHE_SIZE
+    policy = diofant.core.cache.CACHE_POLICY
+    assert stats['_identity'] == {'hits': 1, 'misses': 1, 'maxsize': maxsize,
+                                  'currsize': 1, 'evictions': 0,
+                                  'policy': policy}
@@ -11,11 +11,14 @@
 from diofant.abc import H, n, x, y
 from diofant.core.evalf import (PrecisionExhausted, _create_evalf_table,
                                 as_mpmath, complex_accuracy, scaled_zero)
+from diofant.external import import_module
 from diofant.utilities.lambdify import implemented_function
 
 
 __all__ = ()
 
+numpy = import_module('numpy')
+
 
 def NS(e, n=15, **options):
     return sstr(sympify(e).evalf(n, **options), full_prec=True)
@@ -554,3 +557,38 @@ def test_evalf_bernoulli():
 
 def test_evalf_abs():
     assert Abs(0, evaluate=False).evalf() == 0
+
+
+def test_evalf_batch():
+    e = exp(-x**2/2)*sin(x*y) + Rational(1, 3)*log(1 + y**2)
+    points = [(Rational(i, 3), j) for i in range(1, 4) for j in range(1, 4)]
+    for dps in (15, 30):
+        r = e.evalf_batch((x, y), points, dps)
+        assert r == [e.evalf(dps, subs=dict(zip((x, y), p))) for p in points]
+        assert all(_._prec == Float(1, dps)._prec for _ in r)
+
+    assert sqrt(x).evalf_batch(x, [-4, 4]) == [2*I, 2]
+    assert Float(2).evalf_batch(x, [1, 2]) == [2, 2]
+    assert (x + I*y).evalf_batch([x, y], [(0, 1), (1, 0)]) == [1.0*I, 1]
+    assert (x + 1).evalf_batch(x, [Float(1, 30)], 30) == [Float(2, 30)]
+
+    # unsupported by mpmath
+    e = Integral(exp(-x**2*y), (x, 0, 1))
+    assert e.evalf_batch(y, [1]) == [e.subs({y: 1}).evalf()]
+
+    pytest.raises(ValueError, lambda: (x + y).evalf_batch((x, y), [(1,)]))
+
+
+@pytest.mark.skipif(numpy is None, reason="Couldn't import numpy.")
+def test_evalf_batch_numpy():
+    e = exp(-x**2/2)*sin(x*y)
+    points = numpy.array([(0.5, 1), (1, 2), (2, 3)])
+    r = e.evalf_batch((x, y), points)
+    assert isinstance(r, numpy.ndarray)
+    assert numpy.allclose(r, [float(_) for _ in e.evalf_batch((x, y), points.tolist())])
+
+    r = Float(2).evalf_batch(x, numpy.array([1.0, 2.0]))
+    assert r.tolist() == [2.0, 2.0]
+
+    r = e.evalf_batch((x, y), points, 30)
+    assert isinstance(r, list) and len(r) == 3
@@ -0,0 +1,102 @@
+import random
+
+import pytest
+
+from diofant import FF, QQ, ZZ, Rational, sqrt
+from diofant.matrices import (DomainMatrix, Matrix, NonSquareMatrixError,
+                              ShapeError)
+
+
+__all__ = ()
+
+
+def test_DomainMatrix_basic():
+    pytest.raises(ShapeError, lambda: DomainMatrix([[ZZ(1)]], (1, 2), ZZ))
+
+    A = DomainMatrix.from_Matrix(Matrix([[1, 2], [3, 4]]))
+    assert A.domain == ZZ
+    assert A.shape == (2, 2)
+    assert A[1, 0] == 3
+    assert repr(A) == 'DomainMatrix([[1, 2], [3, 4]], (2, 2), ZZ)'
+    assert A.to_Matrix() == Matrix([[1, 2], [3, 4]])
+    assert A.T == DomainMatrix.from_list([[1, 3], [2, 4]])
+    assert A.copy() == A
+    assert (A == 1) is False
+
+    B = DomainMatrix.from_list([[Rational(1, 2), 0], [0, 1]])
+    assert B.domain == QQ
+    assert (A + B).domain == QQ
+    assert (A + B).to_Matrix() == Matrix([[Rational(3, 2), 2], [3, 5]])
+    assert (A - A) == DomainMatrix.zeros((2, 2), ZZ)
+    assert (A*B).to_Matrix() == Matrix([[Rational(1, 2), 2],
+                                        [Rational(3, 2), 4]])
+    assert (2*A).to_Matrix() == 2*Matrix([[1, 2], [3, 4]])
+    assert A*DomainMatrix.eye(2, ZZ) == A
+    pytest.raises(ShapeError, lambda: A + DomainMatrix.eye(3, ZZ))
+    pytest.raises(ShapeError, lambda: A*DomainMatrix.eye(3, ZZ))
+
+    assert A.convert_to(FF(5)).to_Matrix() == Matrix([[1, 2], [3, 4]])
+    assert A.to_field().domain == QQ
+
+    E = DomainMatrix.from_Matrix(Matrix(0, 3, []))
+    assert E.shape == (0, 3)
+    assert E.T.shape == (3, 0)
+
+
+def test_DomainMatrix_det():
+    assert DomainMatrix.from_list([]).det() == 1
+    pytest.raises(NonSquareMatrixError,
+                  lambda: DomainMatrix.from_list([[1, 2]]).det())
+
+    M = Matrix([[1, 2, 3], [4, 5, 6], [7, 8, 10]])
+    assert DomainMatrix.from_Matrix(M).det() == -3
+    assert DomainMatrix.from_Matrix(M/3).det() == Rational(-1, 9)
+    assert DomainMatrix.from_Matrix(M, FF(2)).det() == 1
+    assert DomainMatrix.from_list([[0, 1], [1, 0]]).det() == -1
+    assert DomainMatrix.from_list([[1, 2], [2, 4]]).det() == 0
+
+    A = DomainMatrix.from_list([[1, sqrt(2)], [sqrt(2), 3]], extension=True)
+    assert A.domain.to_expr(A.det()) == 1
+
+    random.seed(0)
+    for _ in range(5):
+        M = Matrix(6, 6, lambda i, j: Rational(random.randint(-9, 9),
+                                               random.randint(1, 9)))
+        assert DomainMatrix.from_Matrix(M).det() == M.berkowitz_det()
+
+
+def test_DomainMatrix_rref():
+    M = Matrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]])
+    R, pivots = DomainMatrix.from_Matrix(M).rref()
+    assert R.domain == QQ
+    assert pivots == [0, 1]
+    assert R.to_Matrix() == Matrix([[1, 0, 1], [0, 1, 1], [0, 0, 0]])
+    assert DomainMatrix.from_Matrix(M).rank() == 2
+
+    R, pivots = DomainMatrix.from_Matrix(M, FF(3)).rref()
+    assert pivots == [0, 1]
+
+    N = DomainMatrix.from_Matrix(M).nullspace()
+    assert N.to_Matrix() == Matrix([[-1, -1, 1]])
+    assert (DomainMatrix.from_Matrix(M)*N.T).to_Matrix() == Matrix([0, 0, 0])
+
+
+def test_DomainMatrix_inv():
+    M = Matrix([[1, 2], [3, 4]])
+    A = DomainMatrix.from_Matrix(M)
+    assert A.inv().to_Matrix() == M.inverse_ADJ()
+    pytest.raises(ValueError,
+                  lambda: DomainMatrix.from_list([[1, 2], [2, 4]]).inv())
+    pytest.raises(NonSquareMatrixError,
+                  lambda: DomainMatrix.from_list([[1, 2]]).inv())
+
+    B = DomainMatrix.from_Matrix(M, FF(5)).inv()
+    assert B*DomainMatrix.from_Matrix(M, FF(5)) == DomainMatrix.eye(2, FF(5))
+
+
+def test_Matrix_domain_dispatch():
+    M = Matrix([[1, Rational(1, 2), 3], [4, 5, 6], [7, 8, 10]])
+    assert M.det_bareis() == M.berkowitz_det()
+    assert M.inverse_GE() == M.inverse_ADJ()
+    assert M.rref() == (Matrix.eye(3), [0, 1, 2])
+    pytest.raises(ValueError, lambda: Matrix([[1, 2], [2, 4]]).inverse_GE())
@@ -14,9 +14,10 @@
 from diofant.core.numbers import Integer, Rational
 from diofant.domains import QQ, ZZ
 from diofant.ntheory import (discrete_log, divisor_count, divisor_sigma,
-                             divisors, factorint, is_nthpow_residue,
-                             is_primitive_root, is_quad_residue, is_square,
-                             isprime, jacobi_symbol, legendre_symbol, mobius,
+                             divisors, ecm, factorint, factorint_many,
+                             is_nthpow_residue, is_primitive_root,
+                             is_quad_residue, is_square, isprime,
+                             jacobi_symbol, legendre_symbol, mobius,
                              multiplicity, n_order, nextprime, npartitions,
                              nthroot_mod, perfect_power, pollard_pm1,
                              pollard_rho, prevprime, prime, primefactors,
@@ -188,6 +189,13 @@ def test_primepi():
     assert primepi(9096) == 1128
     assert primepi(25023) == 2763
 
+    for n in (1, 2, 3, 10, 2310, 2311, 25023, 10**6 + 3):
+        assert primepi(n, method='sieve') == primepi(n, method='lehmer')
+    assert primepi(10**7, method='sieve') == 664579
+    assert primepi(10**7) == 664579
+    assert primepi(10**10, method='lehmer') == 455052511
+    pytest.raises(ValueError, lambda: primepi(10, method='spam'))
+
 
 def test_generate():
     assert nextprime(-4) == 2
@@ -217,6 +225,14 @@ def test_generate():
     assert s[10] == 29
 
     assert nextprime(2, 2) == 5
+    assert nextprime(10**10, 10) == 10000000207
+    assert nextprime(10**12, 2) == 1000000000061
+
+    ps = list(primerange(10**10, 10**10 + 10**4))
+    assert ps == [n for n in range(10**10, 10**10 + 10**4) if isprime(n)]
+    assert len(list(primerange(10**10, 10**10 + 10**6))) == 43427
+    assert list(primerange(10**20, 10**20 + 200)) == [10**20 + 39, 10**20 + 129,
+                                                      10**20 + 151, 10**20 + 193]
 
     pytest.raises(ValueError, lambda: totient(0))
 
@@ -397,6 +413,31 @@ def test_factorint():
     pytest.raises(ValueError, lambda: factorint(4.5))
 
 
+def test_ecm():
+    p, q = nextprime(10**14), nextprime(10**15)
+
+    assert ecm(p*q) in (p, q)
+    assert ecm(p*q, B1=100, max_curves=1) is None
+    pytest.raises(ValueError, lambda: ecm(4))
+
+    assert factorint(p*q) == {p: 1, q: 1}
+    assert 'ECM' in capture(lambda: factorint(p*q, verbose=1))
+    assert factorint(p*q, workers=2) == {p: 1, q: 1}
+    assert factorint(p**2*q, use_trial=0, use_rho=0,
+                     use_pm1=0) == {p: 2, q: 1}
+
+
+def test_factorint_many():
+    p, q = nextprime(10**14), nextprime(10**15)
+    numbers = [12, p*q, 101, 1]
+    res = [(12, {2: 2, 3: 1}), (p*q, {p: 1, q: 1}), (101, {101: 1}), (1, {})]
+
+    assert list(factorint_many(numbers)) == res
+    assert list(factorint_many(iter(numbers), limit=10)) == [
+        (12, {2: 2, 3: 1}), (p*q, {p*q: 1}), (101, {101: 1}), (1, {})]
+    assert sorted(factorint_many(numbers, workers=2)) == sorted(res)
+
+
 def test_factorint_verbose(capsys):
     out = """Factoring 10201
 Trial division with ints [2 ... 100] and fail_max=600
@@ -2,16 +2,16 @@
 
 import pytest
 
-from diofant.domains import QQ, ZZ
+from diofant.domains import FF, QQ, ZZ
 from diofant.polys import polyconfig as config
 from diofant.polys.fglmtools import _representing_matrices
-from diofant.polys.groebnertools import (Num, Polyn, Sign, cp_key,
-                                         critical_pair, f5_reduce, groebner,
-                                         groebner_gcd, groebner_lcm,
+from diofant.polys.groebnertools import (Num, Polyn, Sign, buchberger, cp_key,
+                                         critical_pair, f4, f5_reduce,
+                                         groebner, groebner_gcd, groebner_lcm,
                                          is_groebner, is_minimal,
                                          is_rewritable_or_comparable, lbp,
-                                         lbp_key, lbp_sub, s_poly, sig,
-                                         sig_key)
+                                         lbp_key, lbp_sub, modgroebner, s_poly,
+                                         sig, sig_key)
 from diofant.polys.orderings import grlex, lex
 from diofant.polys.rings import ring
 
@@ -19,7 +19,7 @@
 __all__ = ()
 
 
-@pytest.mark.parametrize("method", ("buchberger", "f5b"))
+@pytest.mark.parametrize("method", ("buchberger", "f5b", "f4", "modular"))
 def test_groebner(method):
     with config.using(groebner=method):
         R,  x, y = ring("x,y", QQ, lex)
@@ -150,7 +150,7 @@ def test_groebner(method):
         assert not is_minimal(b, R)
 
 
-@pytest.mark.parametrize("method", ("buchberger", "f5b"))
+@pytest.mark.parametrize("method", ("buchberger", "f5b", "f4", "modular"))
 def test_benchmark_minimal_polynomial(method):
     with config.using(groebner=method):
         R,  x, y, z = ring("x,y,z", QQ, lex)
@@ -198,7 +198,7 @@ def test_benchmark_coloring():
     assert groebner(I, R) == [1]
 
 
-@pytest.mark.parametrize("method", ("buchberger", "f5b"))
+@pytest.mark.parametrize("method", ("buchberger", "f5b", "f4", "modular"))
 def test_benchmark_katsura_3(method):
     with config.using(groebner=method):
         R,  x0, x1, x2 = ring("x:3", ZZ, lex)
@@ -223,7 +223,7 @@ def test_benchmark_katsura_3(method):
         ]
 
 
-@pytest.mark.parametrize("method", ("buchberger", "f5b"))
+@pytest.mark.parametrize("method", ("buchberger", "f5b", "f4", "modular"))
 def test_benchmark_katsura_4(method):
     with config.using(groebner=method):
         R,  x0, x1, x2, x3 = ring("x:4", ZZ, lex)
@@ -256,7 +256,7 @@ def test_benchmark_katsura_4(method):
 
 
 @pytest.mark.slow
-@pytest.mark.parametrize("method", ("buchberger", "f5b"))
+@pytest.mark.parametrize("method", ("buchberger", "f5b", "f4", "modular"))
 def test_benchmark_czichowski(method):
     # This is very slow (> 2 minutes on 3.4 GHz) without GMPY
 
@@ -329,7 +329,7 @@ def test_benchmark_czichowski(method):
         ]
 
 
-@pytest.mark.parametrize("method", ("buchberger", "f5b"))
+@pytest.mark.parametrize("method", ("buchberger", "f5b", "f4", "modular"))
 def test_benchmark_cyclic_4(method):
     with config.using(groebner=method):
         R,  a, b, c, d = ring("a,b,c,d", ZZ, lex)
@@ -361,6 +361,31 @@ def test_benchmark_cyclic_4(method):
         ]
 
 
+def test_modgroebner():
+    R, x, y, z = ring("x,y,z", QQ, grlex)
+    F = [x**2 + y*z/3 - 1, x*y - 7*z**2, y**2 - x*z/5 + 2]
+    G = buchberger(F, R)
+
+    assert modgroebner(F, R) == G
+    assert modgroebner([R.zero], R) == []
+
+    with config.using(groebner_workers=2):
+        assert modgroebner(F, R) == G
+
+    R, x, y = ring("x,y", FF(7), lex)
+    F = [x**2 + 3*y, x*y - 1]
+
+    assert modgroebner(F, R) == f4(F, R)
+
+
+def test_is_groebner():
+    R, x, y = ring("x,y", QQ, lex)
+
+    assert is_groebner([]) is True
+    assert is_groebner([x, x**2]) is True
+    assert is_groebner([x**2 + y, x*y]) is False
+
+
 def test_sig_key():
     s1 = sig((0,) * 3, 2)
     s2 = sig((1,) * 3, 4)
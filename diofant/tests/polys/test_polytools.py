@@ -2933,12 +2933,16 @@ def test_groebner():
 
     assert groebner([x**2 - 1, x**3 + 1], method='buchberger') == [x + 1]
     assert groebner([x**2 - 1, x**3 + 1], method='f5b') == [x + 1]
+    assert groebner([x**2 - 1, x**3 + 1], method='f4') == [x + 1]
+    assert groebner([x**2 - 1, x**3 + 1], method='modular') == [x + 1]
 
     pytest.raises(ValueError, lambda: groebner([x, y], method='unknown'))
 
     F = [x**2 - x - 1, (2*x - 1) * y - (x**10 - (1 - x)**10)]
     assert groebner(F, x, y, method='buchberger') == [x**2 - x - 1, y - 55]
     assert groebner(F, x, y, method='f5b') == [x**2 - x - 1, y - 55]
+    assert groebner(F, x, y, method='f4') == [x**2 - x - 1, y - 55]
+    assert groebner(F, x, y, method='modular') == [x**2 - x - 1, y - 55]
 
     # issue sympy/sympy#11623
     pytest.raises(ValueError,
@@ -10,7 +10,7 @@
 from diofant.core import Symbol, symbols
 from diofant.domains import EX, FF, QQ, RR, ZZ
 from diofant.polys.fields import field
-from diofant.polys.orderings import grlex, lex
+from diofant.polys.orderings import grevlex, grlex, lex
 from diofant.polys.polyconfig import using
 from diofant.polys.polyerrors import (CoercionFailed, ExactQuotientFailed,
                                       GeneratorsError, GeneratorsNeeded,
@@ -1045,6 +1045,65 @@ def test_PolyElement_div():
                   lambda: divmod(R(2.0), R(-1.8438812457236466e-19)))
 
 
+def test_PackedPolyElement():
+    pytest.raises(ValueError, lambda: ring("x", ZZ, repr='spam'))
+
+    R, x, y, z = ring("x,y,z", ZZ, repr='packed')
+
+    assert R.repr == 'packed'
+    assert R != ring("x,y,z", ZZ)[0]
+    assert R.clone(domain=QQ).repr == 'packed'
+
+    for order in (lex, grlex, grevlex):
+        R1, x1, y1, z1 = ring("x,y,z", QQ, order)
+        R2, x2, y2, z2 = ring("x,y,z", QQ, order, repr='packed')
+
+        f1, g1 = (x1 - 2*y1 + z1/3 + 1)**4, (x1*y1 - z1**2 + 2)**2
+        f2, g2 = (x2 - 2*y2 + z2/3 + 1)**4, (x2*y2 - z2**2 + 2)**2
+
+        assert dict(f2) == dict(f1)
+        assert dict(f2*g2) == dict(f1*g1)
+        assert dict(f2*3) == dict(f1*3)
+        assert (f2*g2).LM == (f1*g1).LM
+
+        q1, r1 = (f1*g1 + x1).div([g1, x1 - y1])
+        q2, r2 = (f2*g2 + x2).div([g2, x2 - y2])
+
+        assert [dict(_) for _ in q2] == [dict(_) for _ in q1]
+        assert dict(r2) == dict(r1)
+
+    R, x, y = ring("x,y", ZZ, repr='packed')
+
+    assert (x*y + 1).div([R(2)]) == ([0], x*y + 1)
+    assert (4*x*y + 3).div([2*x]) == ([2*y], 3)
+
+    # overflow of packed exponents
+    assert (x**10).div([x - y**10]) == ([x**9 + x**8*y**10 + x**7*y**20 +
+                                         x**6*y**30 + x**5*y**40 +
+                                         x**4*y**50 + x**3*y**60 +
+                                         x**2*y**70 + x*y**80 + y**90],
+                                        y**100)
+
+    # not packable orders
+    R1, x1, y1 = ring("x,y", ZZ, "igrlex")
+    R2, x2, y2 = ring("x,y", ZZ, "igrlex", repr='packed')
+
+    pytest.raises(NotImplementedError, lambda: R2._packing(4))
+
+    assert dict(x2**2*y2) == dict(x1**2*y1) == {(2, 1): 1}
+    assert dict((x2 + y2)*(x2 - 2*y2)) == dict((x1 + y1)*(x1 - 2*y1))
+
+    q1, r1 = (x1**2*y1 + x1).div([x1])
+    q2, r2 = (x2**2*y2 + x2).div([x2])
+
+    assert [dict(_) for _ in q2] == [dict(_) for _ in q1] == [{(1, 1): 1, (0, 0): 1}]
+    assert dict(r2) == dict(r1) == {}
+
+    R, x = ring('x', RR, repr='packed')
+    pytest.raises(PolynomialDivisionFailed,
+                  lambda: divmod(R(2.0), R(-1.8438812457236466e-19)))
+
+
 def test_PolyElement_monic():
     R, x = ring("x", ZZ)
 
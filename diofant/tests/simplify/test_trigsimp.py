@@ -5,6 +5,7 @@
                      exptrigsimp, integrate, log, nan, pi, simplify, sin, sinh,
                      sqrt, symbols, tan, tanh, trigsimp)
 from diofant.abc import a, b, x, y, z
+from diofant.polys import polyconfig as config
 from diofant.simplify.trigsimp import trigsimp_groebner
 from diofant.utilities.randtest import verify_numerically as tn
 
@@ -318,6 +319,22 @@ def test_trigsimp_groebner():
     assert trigsimp_groebner(ex, hints=[(tan, x, y)]) == tan(x + y)
 
 
+@pytest.mark.parametrize("method", ("buchberger", "f5b", "f4", "modular"))
+def test_trigsimp_groebner_method(method):
+    c = cos(x)
+    s = sin(x)
+    ex = (4*s*c + 12*s + 5*c**3 + 21*c**2 + 23*c + 15)/(
+        -s*c**2 + 2*s*c + 15*s + 7*c**3 + 31*c**2 + 37*c + 21)
+    resnum = (5*s - 5*c + 1)
+    resdenom = (8*s - 6*c)
+    results = [resnum/resdenom, (-resnum)/(-resdenom)]
+
+    with config.using(groebner=method):
+        assert trigsimp_groebner(ex) in results
+        ex = (tan(x) + tan(y))/(1 - tan(x)*tan(y))
+        assert trigsimp_groebner(ex, hints=[(tan, x, y)]) == tan(x + y)
+
+
 def test_trigsimp_old(capsys):
     e = 2*sin(x)**2 + 2*cos(x)**2
     assert trigsimp(e, old=True) == 2
@@ -6,6 +6,7 @@
                      symbols)
 from diofant.abc import n, t, x, y, z
 from diofant.polys import ComputationFailed, PolynomialError
+from diofant.polys import polyconfig as config
 from diofant.solvers.polysys import solve_linear_system, solve_poly_system
 
 
@@ -91,6 +92,22 @@ def test_solve_poly_system():
 
 
 @pytest.mark.slow
+@pytest.mark.parametrize("method", ("buchberger", "f5b", "f4", "modular"))
+def test_solve_poly_system_groebner_method(method):
+    f_1 = x**2 + y + z - 1
+    f_2 = x + y**2 + z - 1
+    f_3 = x + y + z**2 - 1
+
+    a, b = sqrt(2) - 1, -sqrt(2) - 1
+
+    with config.using(groebner=method):
+        assert (solve_poly_system([x*y - 2*y, 2*y**2 - x**2], x, y) ==
+                [{x: 0, y: 0}, {x: 2, y: -sqrt(2)}, {x: 2, y: sqrt(2)}])
+        assert (solve_poly_system([f_1, f_2, f_3], x, y, z) ==
+                [{x: 0, y: 0, z: 1}, {x: 0, y: 1, z: 0}, {x: 1, y: 0, z: 0},
+                 {x: a, y: a, z: a}, {x: b, y: b, z: b}])
+
+
 def test_solve_poly_system2():
     assert solve_poly_system((x, y)) == [{x: 0, y: 0}]
     assert (solve_poly_system((x**3 + y**2,)) ==
@@ -14,7 +14,8 @@
 from diofant.utilities.decorator import conserve_mpmath_dps
 from diofant.utilities.lambdify import (MATH_TRANSLATIONS, MPMATH_TRANSLATIONS,
                                         NUMPY_TRANSLATIONS, _get_namespace,
-                                        implemented_function, lambdastr)
+                                        _lambdacode, implemented_function,
+                                        lambdastr, set_lambdify_cache_dir)
 
 
 __all__ = ()
@@ -580,3 +581,80 @@ def test_Min_Max():
 def test_sympyissue_12092():
     f = implemented_function('f', lambda x: x**2)
     assert f(f(2)).evalf() == Float(16)
+
+
+def test_lambdify_cache(tmpdir):
+    _lambdacode.cache_clear()
+    f1 = lambdify((x, y), sin(x)*y, 'math')
+    f2 = lambdify((x, y), sin(x)*y, 'diofant')
+    assert _lambdacode.cache_info()[:2] == (1, 1)
+    assert f1(1, 2) == 2*math.sin(1)
+    assert f2(1, 2) == 2*sin(1)
+    f3 = lambdify((x, y), sin(x)*y, 'mpmath')
+    assert _lambdacode.cache_info()[:2] == (1, 2)
+    assert isinstance(f3(1, 2), mpmath.mpf)
+    assert lambdify((x, y), sin(x)*y, 'math', cache=False)(1, 2) == f1(1, 2)
+
+    # lists and tuples should not be confused
+    assert lambdify(x, [x, (x, 1)])(2) == [2, (2, 1)]
+    assert lambdify(x, (x, [x, 1]))(2) == (2, [2, 1])
+    assert lambdify(x, [x, True])(2) == [2, True]
+    assert lambdify(x, [x, 1])(2) == [2, 1]
+    assert lambdify(x, {x: [1]})(2) == {2: [1]}
+
+    # unhashable expressions are not cached
+    info = _lambdacode.cache_info()
+    assert lambdify(x, Matrix([x]), 'diofant')(2) == Matrix([2])
+    assert _lambdacode.cache_info().currsize == info.currsize
+
+    try:
+        set_lambdify_cache_dir(str(tmpdir))
+        f = lambdify((x, y), cos(x) + y, 'math')
+        assert len(tmpdir.listdir()) == 1
+        _lambdacode.cache_clear()
+        g = lambdify((x, y), cos(x) + y, 'math')
+        assert _lambdacode.cache_info().misses == 1
+        assert f(1, 2) == g(1, 2) == math.cos(1) + 2
+        assert f.__doc__ == g.__doc__
+
+        # broken files are ignored
+        tmpdir.listdir()[0].write('spam')
+        _lambdacode.cache_clear()
+        assert lambdify((x, y), cos(x) + y, 'math')(1, 2) == f(1, 2)
+
+        # local printers are not persisted
+        def myprinter(expr):
+            return LambdaPrinter().doprint(expr)
+        assert lambdify(x, cos(x) + 1, 'math', printer=myprinter)(0) == 2
+        assert len(tmpdir.listdir()) == 1
+        assert lambdify(x, x + 1, 'math', printer=LambdaPrinter())(0) == 1
+        assert len(tmpdir.listdir()) == 2
+    finally:
+        set_lambdify_cache_dir(None)
+
+
+def test_lambdify_cse():
+    e = exp(-x**2/2)
+    assert lambdastr(x, sin(x**2) + x**2, cse=True) == (
+        'def _lambdifygenerated(x):\n'
+        '    x0 = x**2\n'
+        '    return (x0 + sin(x0))\n')
+    assert lambdastr(x, 'x + 1', cse=True) == (
+        'def _lambdifygenerated(x):\n'
+        '    return (x + 1)\n')
+
+    f = lambdify(x, e + e**2, 'math', cse=True)
+    assert f(1) == math.exp(-0.5) + math.exp(-1)
+    assert '_lambdifygenerated' not in f.__globals__
+
+    f = lambdify((x, (y, z)), [e*y, (e*z, e)], 'math', cse=True)
+    assert f(0, (2, 3)) == [2, (3, 1)]
+    f = lambdify((x, y), {e: y*e}, 'math', cse=True)
+    assert f(0, 2) == {1: 2}
+
+    f = lambdify((x, y), Matrix([x*y, sin(x*y)]).jacobian([x, y]),
+                 'diofant', cse=True)
+    assert f(0, 1) == Matrix([[1, 0], [1, 0]])
+
+    f = lambdify([], 1, cse=True)
+    assert f() == 1
@@ -3,9 +3,13 @@
 lambda functions which can be used to calculate numerical values very fast.
 """
 
+import hashlib
 import inspect
+import json
+import os
 import textwrap
 
+from ..core.cache import cacheit
 from ..core.compatibility import is_sequence, iterable
 from ..external import import_module  # noqa: F401
 from .decorator import doctest_depends_on
@@ -89,6 +93,12 @@
     "ImmutableDenseMatrix": "array",
 }
 
+# Size of the cache of generated code, see set_cache_size().
+LAMBDIFY_CACHE_SIZE = 1024
+
+# Directory, where generated code is persisted, see set_lambdify_cache_dir().
+LAMBDIFY_CACHE_DIR = os.getenv('DIOFANT_LAMBDIFY_CACHE_DIR')
+
 # Available modules:
 MODULES = {
     "math": (MATH, MATH_DEFAULT, MATH_TRANSLATIONS, ("from math import *",)),
@@ -142,9 +152,102 @@ def _import(module):
         namespace[diofantname] = namespace[translation]
 
 
+def set_lambdify_cache_dir(path):
+    """Set directory to persist the code, generated by :func:`lambdify`.
+
+    Warm processes will skip printing of expressions, if they were
+    lambdified before with same arguments and printer.  The ``None``
+    value disables persistence.  The default is taken from the
+    ``DIOFANT_LAMBDIFY_CACHE_DIR`` environment variable.
+
+    """
+    global LAMBDIFY_CACHE_DIR
+
+    if path is not None:
+        os.makedirs(path, exist_ok=True)
+    LAMBDIFY_CACHE_DIR = path
+
+
+def _freeze(obj):
+    """Return a hashable key for obj, see :func:`_thaw`."""
+    if type(obj) in (list, tuple):
+        return type(obj), tuple(map(_freeze, obj))
+    elif type(obj) is dict:
+        return dict, tuple(map(_freeze, obj.items()))
+    return type(obj), obj
+
+
+def _thaw(key):
+    cls, obj = key
+    if cls in (list, tuple, dict):
+        return cls(map(_thaw, obj))
+    return obj
+
+
+def _printer_name(printer):
+    """Return a name for printer, that is stable across processes."""
+    if printer is None:
+        return 'lambdarepr'
+    elif inspect.isfunction(printer) or inspect.isclass(printer):
+        name = printer.__module__ + '.' + printer.__qualname__
+        return None if '<locals>' in name else name
+    else:
+        name = _printer_name(type(printer))
+        settings = sorted(getattr(printer, '_settings', {}).items())
+        return name and name + repr(settings)
+
+
+def _compile(lstr):
+    mode = 'exec' if lstr.startswith('def ') else 'eval'
+    return compile(lstr, '<lambdify>', mode)
+
+
+def _lambdacode(args, expr, printer, dummify, cse):
+    """Return source, code and string form of expr for lambdify.
+
+    The result is cached and, optionally, persisted to the disk.
+
+    """
+    from .. import __version__
+    from ..printing import srepr
+
+    args, expr = map(_thaw, (args, expr))
+    path = None
+    name = _printer_name(printer)
+    if LAMBDIFY_CACHE_DIR is not None and name is not None:
+        key = repr((__version__, srepr(args), srepr(expr), name,
+                    dummify, cse))
+        key = hashlib.sha256(key.encode()).hexdigest()
+        path = os.path.join(LAMBDIFY_CACHE_DIR, key + '.json')
+        try:
+            with open(path) as f:
+                data = json.load(f)
+            lstr, expr_str = data['lambdastr'], data['expr']
+            return lstr, _compile(lstr), expr_str
+        except (OSError, ValueError, KeyError):
+            pass
+
+    lstr = lambdastr(args, expr, printer=printer, dummify=dummify, cse=cse)
+    code = _compile(lstr)
+    expr_str = str(expr)
+
+    if path is not None:
+        tmp = '%s.%d' % (path, os.getpid())
+        try:
+            with open(tmp, 'w') as f:
+                json.dump({'lambdastr': lstr, 'expr': expr_str}, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return lstr, code, expr_str
+
+
+_lambdacode = cacheit(_lambdacode, maxsize=LAMBDIFY_CACHE_SIZE)
+
+
 @doctest_depends_on(modules=('numpy'))
 def lambdify(args, expr, modules=None, printer=None, use_imps=True,
-             dummify=True):
+             dummify=True, cache=True, cse=False):
     """
     Returns a lambda function for fast calculation of numerical values.
 
@@ -258,6 +361,20 @@ def lambdify(args, expr, modules=None, printer=None, use_imps=True,
     ``lambdify`` always prefers ``_imp_`` implementations to implementations
     in other namespaces, unless the ``use_imps`` input parameter is False.
 
+    With ``cse=True``, common subexpressions are eliminated (see
+    :func:`~diofant.simplify.cse_main.cse`) and the generated function
+    computes them once, as temporaries:
+
+    >>> f = lambdify(x, exp(-x**2/2) + sin(exp(-x**2/2)), 'math', cse=True)
+    >>> f(0)
+    1.8414709848078965
+
+    Generated code is cached, using arguments, expression and printer as
+    the key, unless the ``cache`` parameter is False.  The cache has LRU
+    eviction policy and its size can be changed with
+    :func:`~diofant.core.cache.set_cache_size`.  See also
+    :func:`set_lambdify_cache_dir` to persist generated code.
+
     """
     from ..core import Symbol
     from .iterables import flatten
@@ -320,12 +437,23 @@ def lambdify(args, expr, modules=None, printer=None, use_imps=True,
             names.append('arg_' + str(n))
 
     # Create lambda function.
-    lstr = lambdastr(args, expr, printer=printer, dummify=dummify)
+    if cache:
+        lstr, code, expr_str = _lambdacode(_freeze(args), _freeze(expr),
+                                           printer, dummify, cse)
+    else:
+        lstr = lambdastr(args, expr, printer=printer, dummify=dummify,
+                         cse=cse)
+        code = _compile(lstr)
+        expr_str = str(expr)
     flat = '__flatten_args__'
 
     if flat in lstr:
         namespace.update({flat: flatten})
-    func = eval(lstr, namespace)
+    if cse:
+        exec(code, namespace)
+        func = namespace.pop('_lambdifygenerated')
+    else:
+        func = eval(code, namespace)
     # For numpy lambdify, wrap all input arguments in arrays.
     if module_provided and 'numpy' in namespaces:
         def array_wrap(funcarg):
@@ -336,7 +464,6 @@ def wrapper(*argsx, **kwargsx):
     # Apply the docstring
     sig = "func({0})".format(", ".join(str(i) for i in names))
     sig = textwrap.fill(sig, subsequent_indent=' '*8)
-    expr_str = str(expr)
     if len(expr_str) > 78:
         expr_str = textwrap.wrap(expr_str, 75)[0] + '...'
     func.__doc__ = ("Created with lambdify. Signature:\n\n{sig}\n\n"
@@ -357,10 +484,13 @@ def _get_namespace(m):
         raise TypeError("Argument must be either a string, dict or module but it is: %s" % m)
 
 
-def lambdastr(args, expr, printer=None, dummify=False):
+def lambdastr(args, expr, printer=None, dummify=False, cse=False):
     """
     Returns a string that can be evaluated to a lambda function.
 
+    If ``cse`` is True, returns the source of the ``_lambdifygenerated()``
+    function instead, that computes common subexpressions first.
+
     Examples
     ========
 
@@ -376,6 +506,11 @@ def lambdastr(args, expr, printer=None, dummify=False):
     >>> lambdastr((x, (y, z)), x + y)
     'lambda _0,_1: (lambda x,y,z: (x + y))(*list(__flatten_args__([_0,_1])))'
 
+    >>> print(lambdastr(x, sin(x**2) + x**2, cse=True))
+    def _lambdifygenerated(x):
+        x0 = x**2
+        return (x0 + sin(x0))
+
     """
     # Transforming everything to strings.
     from ..core import Dummy, sympify, Symbol, Function
@@ -433,10 +568,17 @@ def isiter(l):
         dum_args = [lambdarepr(Dummy(str(i))) for i in range(len(args))]
         iter_args = ','.join([i if isiter(a) else i
                               for i, a in zip(dum_args, args)])
-        lstr = lambdastr(flatten(args), expr, printer=printer, dummify=dummify)
+        lstr = lambdastr(flatten(args), expr, printer=printer,
+                         dummify=dummify, cse=cse)
         flat = '__flatten_args__'
-        rv = 'lambda %s: (%s)(*list(%s([%s])))' % (
-            ','.join(dum_args), lstr, flat, iter_args)
+        if cse:
+            header, body = lstr.split('\n', 1)
+            params = header[header.index('(') + 1:header.rindex(')')]
+            rv = 'def _lambdifygenerated(%s):\n    [%s] = %s([%s])\n%s' % (
+                ','.join(dum_args), params, flat, iter_args, body)
+        else:
+            rv = 'lambda %s: (%s)(*list(%s([%s])))' % (
+                ','.join(dum_args), lstr, flat, iter_args)
         if len(re.findall(r'\b%s\b' % flat, rv)) > 1:
             raise ValueError('the name %s is reserved by lambdastr' % flat)
         return rv
@@ -454,11 +596,48 @@ def isiter(l):
             pass
         else:
             expr = sub_expr(expr, dummies_dict)
+
+    if cse:
+        if isinstance(expr, str):
+            replacements = []
+        else:
+            replacements, expr = _cse(expr)
+        lines = ['    %s = %s\n' % (lambdarepr(s), lambdarepr(e))
+                 for s, e in replacements]
+        return "def _lambdifygenerated(%s):\n%s    return (%s)\n" % (
+            args, ''.join(lines), lambdarepr(expr))
+
     expr = lambdarepr(expr)
 
     return "lambda %s: (%s)" % (args, expr)
 
 
+def _cse(expr):
+    """Eliminate common subexpressions in expr.
+
+    The expr could be a (nested) list, tuple or dict of expressions.
+
+    """
+    from ..core import Basic
+    from ..matrices import MatrixBase
+    from ..simplify import cse
+
+    def walk(e, f):
+        if type(e) in (list, tuple):
+            return type(e)(walk(a, f) for a in e)
+        elif type(e) is dict:
+            return {walk(k, f): walk(v, f) for k, v in e.items()}
+        elif isinstance(e, (Basic, MatrixBase)):
+            return f(e)
+        return e
+
+    exprs = []
+    walk(expr, exprs.append)
+    replacements, exprs = cse(exprs)
+    exprs = iter(exprs)
+    return replacements, walk(expr, lambda e: next(exprs))
+
+
 def _imp_namespace(expr, namespace=None):
     """ Return namespace dict with function implementations
 